@@ -1,14 +1,38 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import io
-import PyPDF2 # Used for basic PDF text extraction
-# Import camelot for PDF table extraction. Requires Ghostscript to be installed.
-try:
-    import camelot
-except ImportError:
-    st.error("Camelot library not found. Please install it using: pip install 'camelot-py[cv]'")
-    st.error("Also, ensure Ghostscript is installed and in your system's PATH. See https://camelot-py.readthedocs.io/en/master/user/install-deps.html for details.")
-    camelot = None
+import sys
+import codecs
+import csv
+import importlib.util
+import os
+import math
+import time
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+import workers # Process-pool worker functions (must live outside this script)
+
+# Heavy and optional backends are imported on first use, not at startup, so sessions that
+# only upload a CSV never pay for them. Only their availability is checked here (cheap).
+# - PyPDF2: basic PDF text extraction.
+# - camelot: PDF table extraction (pulls in OpenCV; requires Ghostscript). Imported by the worker processes.
+# - pyarrow: multithreaded CSV engine and Arrow-backed dtypes.
+# - openpyxl: streaming read-only Excel loader; pandas' own reader is used without it.
+# - python-calamine (Rust): optional, much faster Excel engine for pandas.
+CAMELOT_AVAILABLE = importlib.util.find_spec("camelot") is not None
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
 
 
 # --- Configuration and Setup ---
@@ -18,65 +42,898 @@ st.set_page_config(
     initial_sidebar_state="expanded" # Makes the sidebar permanent
 )
 
+# --- Parse Cache (reused across Streamlit reruns) ---
+
+# Upper bound on the memory held by parsed uploads that are kept across reruns.
+PARSE_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+class ParseCache:
+    """
+    Size-bounded LRU cache for parsed uploads.
+    Entries are keyed by a fingerprint of the uploaded bytes plus the loader parameters,
+    so reruns triggered by unrelated widgets reuse the already-parsed result.
+    """
+
+    def __init__(self, max_bytes=PARSE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict() # key -> (value, size in bytes), oldest first
+        self._lock = threading.Lock() # Sessions run in separate threads but share this cache
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key) # Mark as most recently used
+            return entry[0]
+
+    def put(self, key, value):
+        size = estimate_nbytes(value)
+        if size > self.max_bytes:
+            return # Caching it would evict everything else and still not fit
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False) # Evict least recently used
+                self.current_bytes -= evicted_size
+
+def estimate_nbytes(value):
+    """
+    Estimates the memory held by a parsed result (DataFrame, text or a dict/list of them).
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+@st.cache_resource
+def get_parse_cache():
+    """
+    Returns the process-wide parse cache. Keys include a content hash, so sharing it
+    between sessions only ever reuses results for identical uploads.
+    """
+    return ParseCache()
+
+def file_fingerprint(uploaded_file):
+    """
+    Returns a content hash of the uploaded file.
+    The hash is remembered per upload (Streamlit's file_id) so large files are only hashed once.
+    """
+    file_id = getattr(uploaded_file, 'file_id', None)
+    fingerprints = st.session_state.setdefault('_upload_fingerprints', {})
+    if file_id is not None and file_id in fingerprints:
+        return fingerprints[file_id]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(uploaded_file.getbuffer())
+    fingerprint = f"{digest.hexdigest()}-{uploaded_file.getbuffer().nbytes}"
+    if file_id is not None:
+        fingerprints[file_id] = fingerprint
+    return fingerprint
+
+def cached_parse(uploaded_file, loader, params, parse_fn, announce=True):
+    """
+    Returns parse_fn()'s result for this upload, reusing an earlier parse when the file
+    content and the loader parameters are unchanged. Failed parses (None) are not cached.
+    announce=False skips the sidebar note on reuse (for small intermediate results).
+    """
+    key = (file_fingerprint(uploaded_file), loader, repr(sorted(params.items())))
+    cache = get_parse_cache()
+    result = cache.get(key)
+    if result is not None:
+        if announce:
+            st.sidebar.caption("♻️ Reusing previously parsed data.")
+        return result
+
+    uploaded_file.seek(0) # Each loader expects to read from the start of the file
+    result = parse_fn()
+    if result is not None:
+        cache.put(key, result)
+    return result
+
+# --- Encoding and Dialect Detection (on a bounded sample, before the full parse) ---
+
+# Bytes inspected to detect the encoding and dialect before parsing the whole file.
+SNIFF_SAMPLE_BYTES = 64 * 1024
+
+# Delimiters offered in the sidebar (label -> delimiter), in display order.
+DELIMITER_OPTIONS = {
+    'Comma (,)': ',',
+    'Tab (\t)': '\t',
+    'Semicolon (;)': ';',
+    'Pipe (|)': '|',
+}
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE one.
+BYTE_ORDER_MARKS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Bytes 0x80-0x9F that cp1252 leaves undefined; seeing one means the text is not cp1252.
+CP1252_UNDEFINED_BYTES = {0x81, 0x8D, 0x8F, 0x90, 0x9D}
+
+# Compressed uploads: file suffix -> pandas compression name.
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+
+def split_compression(file_name):
+    """
+    Returns (file name without the compression suffix, pandas compression name or None),
+    e.g. 'sales.csv.gz' -> ('sales.csv', 'gzip').
+    """
+    for suffix, compression in COMPRESSION_SUFFIXES.items():
+        if file_name.endswith(suffix):
+            return file_name[:-len(suffix)], compression
+    return file_name, None
+
+def open_decompressed(uploaded_file, compression):
+    """
+    Returns a file object that decompresses the upload as it is read, so the uncompressed
+    payload is never held in memory. Closing it leaves the upload open.
+    """
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj=uploaded_file, mode='rb')
+    if compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(uploaded_file, mode='rb')
+    if compression == 'xz':
+        import lzma
+        return lzma.LZMAFile(uploaded_file, mode='rb')
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(uploaded_file, closefd=False)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+def read_sample(uploaded_file, size=SNIFF_SAMPLE_BYTES, compression=None):
+    """
+    Returns the first `size` bytes of the uploaded file (decompressed if `compression` is set)
+    without moving its file pointer.
+    """
+    position = uploaded_file.tell()
+    uploaded_file.seek(0)
+    if compression:
+        with open_decompressed(uploaded_file, compression) as stream:
+            parts = []
+            remaining = size
+            while remaining > 0: # Decompressors may return fewer bytes than requested
+                part = stream.read(remaining)
+                if not part:
+                    break
+                parts.append(part)
+                remaining -= len(part)
+            sample = b"".join(parts)
+    else:
+        sample = uploaded_file.read(size)
+    uploaded_file.seek(position)
+    return sample
+
+def detect_encoding(sample):
+    """
+    Guesses the text encoding of a byte sample: BOM first, then UTF-8 validation,
+    then cp1252 vs latin1 based on the bytes in the 0x80-0x9F range.
+    """
+    for bom, encoding in BYTE_ORDER_MARKS:
+        if sample.startswith(bom):
+            return encoding
+
+    try:
+        # final=False: the sample may end in the middle of a multi-byte character
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    # In latin1 the 0x80-0x9F range holds control characters that never appear in real text,
+    # while cp1252 maps most of them to printable characters (smart quotes, €, ...).
+    if any(byte in CP1252_UNDEFINED_BYTES for byte in sample):
+        return 'latin1'
+    return 'cp1252'
+
+def _looks_numeric(value):
+    try:
+        float(value.replace(',', '')) # Allow thousands separators
+        return True
+    except ValueError:
+        return False
+
+def _header_votes(rows):
+    """
+    Votes on whether the first row is a header: in columns whose values are mostly numeric,
+    a non-numeric first cell votes for a header and a numeric one votes against.
+    Returns (header votes, data votes); text-only columns don't vote.
+    """
+    header_votes = data_votes = 0
+    for col_index, first_value in enumerate(rows[0] if rows else []):
+        values = [row[col_index] for row in rows[1:] if col_index < len(row) and row[col_index].strip()]
+        if not values or sum(_looks_numeric(v) for v in values) < 0.8 * len(values):
+            continue # Text columns say nothing about the header
+        if _looks_numeric(first_value):
+            data_votes += 1
+        else:
+            header_votes += 1
+    return header_votes, data_votes
+
+def _sniff_has_header(rows):
+    """
+    Guesses whether the first row of a delimited file is a header (see _header_votes()).
+    csv.Sniffer.has_header is not used because it answers "no header" for all-text files.
+    """
+    if len(rows) < 2:
+        return True
+    header_votes, data_votes = _header_votes(rows)
+    return header_votes >= data_votes # Files without numeric columns are assumed to have a header
+
+def sniff_dialect(sample, encoding, default_delimiter=','):
+    """
+    Detects the delimiter, quote character and header presence from a leading byte sample.
+    Returns a dictionary with 'delimiter', 'quotechar' and 'has_header'.
+    """
+    text = sample.decode(encoding, errors='replace')
+    if len(sample) >= SNIFF_SAMPLE_BYTES and '\n' in text:
+        text = text[:text.rindex('\n')] # Drop the last line, it is probably cut off
+
+    dialect = {'delimiter': default_delimiter, 'quotechar': '"', 'has_header': True}
+    try:
+        sniffed = csv.Sniffer().sniff(text, delimiters=''.join(DELIMITER_OPTIONS.values()))
+        dialect['delimiter'] = sniffed.delimiter
+        dialect['quotechar'] = sniffed.quotechar or '"'
+    except csv.Error:
+        pass # Not enough structure in the sample to tell; keep the defaults
+
+    rows = list(csv.reader(io.StringIO(text), delimiter=dialect['delimiter'], quotechar=dialect['quotechar']))[:50]
+    dialect['has_header'] = _sniff_has_header([row for row in rows if row])
+    return dialect
+
+# --- Memory-Saving Dtype Planning (CSV/TSV) ---
+
+# Rows parsed with inferred dtypes to plan the full parse.
+DTYPE_PLAN_SAMPLE_ROWS = 10_000
+# Text columns with at most this share of distinct values in the sample are loaded as 'category'.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def format_bytes(size):
+    """
+    Formats a size in bytes for display (e.g. '12.3 MB').
+    """
+    for unit in ('bytes', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:,.0f} {unit}" if unit == 'bytes' else f"{size:,.1f} {unit}"
+        size /= 1024
+
+def plan_dtypes(sample):
+    """
+    Picks compact dtypes from a sample parsed with inferred dtypes. Returns a dictionary with
+    'dtypes' ({column: dtype}, passed to the full parse) and 'downcast' (numeric columns
+    narrowed after it, see downcast_numeric()):
+    - Text with few distinct values becomes 'category'; other text becomes Arrow strings.
+      Neither can fail on values the sample did not show.
+    - Integer and float columns are downcast after the parse from the full column's values:
+      parsing straight into a narrow integer dtype silently wraps values outside the range
+      seen in the sample, and one fractional value later in the file would not fit an integer dtype.
+    """
+    dtypes = {}
+    downcast = []
+    for col in sample.columns:
+        series = sample[col]
+        values = series.dropna()
+        if pd.api.types.is_bool_dtype(series) or values.empty:
+            continue # Booleans are already 1 byte; all-missing columns give nothing to plan from
+        if pd.api.types.is_integer_dtype(series):
+            downcast.append(col)
+        elif pd.api.types.is_float_dtype(series):
+            downcast.append(col)
+        elif workers.is_text_column(series):
+            if values.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(values):
+                dtypes[col] = 'category'
+            elif pd.api.types.is_object_dtype(series) and PYARROW_AVAILABLE:
+                dtypes[col] = 'string[pyarrow]' # pandas 3 already infers Arrow-backed strings
+    return {'dtypes': dtypes, 'downcast': downcast}
+
+def downcast_numeric(df, columns):
+    """
+    Narrows the given numeric columns in place to the smallest dtype that holds every value:
+    integers by their range; floats holding only whole numbers to integers (nullable ones, e.g.
+    'Int8', if values are missing), other floats to float32 only where that loses no precision.
+    Columns that turned out not to be numeric in the full file are left alone.
+    """
+    for col in columns:
+        if col not in df.columns or pd.api.types.is_bool_dtype(df[col]):
+            continue
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        elif pd.api.types.is_float_dtype(df[col]):
+            values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+            is_missing = np.isnan(values)
+            present = values[~is_missing]
+            # Whole numbers below 2**53 convert to integers exactly
+            if len(present) and (np.abs(present) < 2 ** 53).all() and (present % 1 == 0).all():
+                integers = df[col].astype('Int64' if is_missing.any() else 'int64')
+                df[col] = pd.to_numeric(integers, downcast='integer')
+                continue
+            narrow = df[col].astype('float32')
+            if np.array_equal(narrow.to_numpy(dtype='float64'), values, equal_nan=True):
+                df[col] = narrow
+    return df
+
+def plan_csv_dtypes(uploaded_file, sample_rows=DTYPE_PLAN_SAMPLE_ROWS, **read_options):
+    """
+    Parses the first rows of a CSV/TSV file and plans compact dtypes for the full parse
+    (see plan_dtypes()). The plan also records the sample's memory per row with inferred
+    and with planned dtypes, to estimate the saving. Returns None if the sample cannot be parsed.
+    """
+    try:
+        sample = read_csv_tsv(uploaded_file, nrows=sample_rows, **read_options)
+    except Exception:
+        return None # The full parse reports the error
+    plan = plan_dtypes(sample)
+    planned = downcast_numeric(sample.astype(plan['dtypes']), plan['downcast'])
+    rows = max(len(sample), 1)
+    plan['sample_rows'] = len(sample)
+    plan['default_bytes_per_row'] = sample.memory_usage(index=False, deep=True).sum() / rows
+    plan['planned_bytes_per_row'] = planned.memory_usage(index=False, deep=True).sum() / rows
+    return plan
+
+def memory_saving_report(plan, df):
+    """
+    Compares the loaded DataFrame's memory with the memory the inferred dtypes would have
+    taken (projected from the sample). Returns a dictionary of sizes in bytes and savings.
+    """
+    default_per_row = plan['default_bytes_per_row']
+    projected_default = default_per_row * len(df)
+    actual = int(df.memory_usage(index=False, deep=True).sum())
+    return {
+        'estimated_saving': 1 - plan['planned_bytes_per_row'] / default_per_row if default_per_row else 0.0,
+        'projected_default_bytes': projected_default,
+        'actual_bytes': actual,
+        'actual_saving': 1 - actual / projected_default if projected_default else 0.0,
+    }
+
 # --- Helper Functions for Data Loading ---
 
-def load_csv_tsv(uploaded_file, delimiter=','):
+@contextlib.contextmanager
+def spooled_upload(uploaded_file, suffix=''):
+    """
+    Writes the uploaded file to a temporary file and yields its path.
+    The temporary file is removed afterwards.
+    """
+    handle = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        with handle:
+            handle.write(uploaded_file.getbuffer())
+        yield handle.name
+    finally:
+        # A worker that was still running when its shard got cancelled may hold the file open (Windows)
+        with contextlib.suppress(OSError):
+            os.remove(handle.name)
+
+def load_csv_tsv(uploaded_file, delimiter=',', engine='c', arrow_dtypes=False,
+                 encoding='utf-8', quotechar='"', header='infer', compression=None, dtype_plan=None,
+                 usecols=None):
     """
     Loads a CSV or TSV file into a Pandas DataFrame.
-    Handles potential decoding errors.
+    `encoding`, `quotechar` and `header` should come from detect_encoding()/sniff_dialect() so
+    the file is parsed only once; if a byte beyond the sniffed sample still fails to decode,
+    it is re-read as latin1.
+    engine='pyarrow' uses PyArrow's multithreaded reader (optionally keeping Arrow-backed
+    dtypes) and falls back to the default C parser if PyArrow rejects the file.
+    `dtype_plan` (from plan_csv_dtypes()) parses text columns straight into compact dtypes
+    and narrows numeric columns once parsed, so the file is never parsed twice.
+    `usecols` (see csv_column_names()) restricts the parse to those columns; the others are
+    tokenized but never converted or stored.
     """
+    read_kwargs = {'delimiter': delimiter, 'quotechar': quotechar, 'header': header, 'usecols': usecols,
+                   'compression': compression} # Compressed files are decompressed as a stream while parsing
+    if dtype_plan is not None:
+        read_kwargs['dtype'] = dtype_plan['dtypes']
+    if engine == 'pyarrow':
+        if not PYARROW_AVAILABLE:
+            st.warning("PyArrow is not installed. Using the default CSV parser instead.")
+        else:
+            try:
+                backend_kwargs = {'dtype_backend': 'pyarrow'} if arrow_dtypes else {}
+                df = pd.read_csv(uploaded_file, engine='pyarrow', encoding=encoding,
+                                 **read_kwargs, **backend_kwargs)
+                return df if dtype_plan is None else downcast_numeric(df, dtype_plan['downcast'])
+            except Exception as e:
+                st.info(f"PyArrow could not parse this file ({e}). Falling back to the default CSV parser.")
+                uploaded_file.seek(0) # Reset file pointer
+
     try:
-        # Attempt to read with specified delimiter
-        df = pd.read_csv(uploaded_file, delimiter=delimiter)
-        return df
-    except UnicodeDecodeError:
-        # If decode error, try reading with 'latin1' encoding
-        uploaded_file.seek(0) # Reset file pointer
-        df = pd.read_csv(uploaded_file, delimiter=delimiter, encoding='latin1')
-        return df
+        df = read_csv_tsv(uploaded_file, encoding=encoding, **read_kwargs)
+        return df if dtype_plan is None else downcast_numeric(df, dtype_plan['downcast'])
     except Exception as e:
         st.error(f"Error loading CSV/TSV: {e}")
         return None
 
+def read_csv_tsv(uploaded_file, encoding='utf-8', **read_kwargs):
+    """
+    Parses a CSV/TSV file with the default C parser, re-reading it as latin1 if a byte
+    does not decode. Raises on any other error and never calls Streamlit, so it can run
+    in a worker thread.
+    """
+    try:
+        # Attempt to read with specified delimiter and detected encoding
+        return pd.read_csv(uploaded_file, encoding=encoding, **read_kwargs)
+    except UnicodeDecodeError:
+        # The sample decoded fine but a later byte did not; 'latin1' accepts any byte
+        uploaded_file.seek(0) # Reset file pointer
+        return pd.read_csv(uploaded_file, encoding='latin1', **read_kwargs)
+
+def csv_column_names(uploaded_file, **read_options):
+    """
+    Returns the column names of a CSV/TSV file by parsing its header only (no data rows).
+    Without a header row the columns are numbered from 0, as in pd.read_csv.
+    Returns None if the header cannot be parsed.
+    """
+    try:
+        return list(read_csv_tsv(uploaded_file, nrows=0, **read_options).columns)
+    except Exception:
+        return None # The full parse reports the error
+
+def select_columns_sidebar(file_name, columns):
+    """
+    Lets the user restrict the load to some of the file's columns, for very wide files.
+    Returns the selected columns in file order, or None to load every column.
+    """
+    if not columns or not st.sidebar.checkbox(
+        f"Load only selected columns ({len(columns):,} available)",
+        value=False,
+        key=f"project_columns_{file_name}"
+    ):
+        return None
+    selected = set(st.sidebar.multiselect(
+        "Columns to load:", columns,
+        key=f"selected_columns_{file_name}"
+    ))
+    if not selected:
+        st.sidebar.info("Select at least one column. Every column is loaded until then.")
+        return None
+    return [col for col in columns if col in selected]
+
+# Excel engines offered in the sidebar (label -> engine name used by read_excel_sheet()).
+EXCEL_ENGINE_OPTIONS = {
+    'openpyxl (streaming, read-only)': 'openpyxl-stream',
+    'calamine (fast)': 'calamine',
+    'pandas (default)': 'pandas',
+}
+
+def list_excel_sheets(uploaded_file):
+    """
+    Lists the sheets of an Excel file without loading cell data.
+    Returns a list of (sheet name, rows, columns); dimensions are None when unknown.
+    For .xlsx the dimensions come from each sheet's stored dimension record.
+    """
+    if uploaded_file.name.endswith('.xlsx') and OPENPYXL_AVAILABLE:
+        import openpyxl
+        workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+        try:
+            return [(ws.title, ws.max_row, ws.max_column) for ws in workbook.worksheets]
+        finally:
+            workbook.close()
+    return [(name, None, None) for name in pd.ExcelFile(uploaded_file).sheet_names]
+
+def excel_sheet_columns(uploaded_file, sheet_name):
+    """
+    Returns the column names of one sheet from its header row only.
+    """
+    if uploaded_file.name.endswith('.xlsx') and OPENPYXL_AVAILABLE:
+        import openpyxl
+        workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+        try:
+            header = next(workbook[sheet_name].iter_rows(values_only=True), ())
+        finally:
+            workbook.close()
+        return workers.excel_column_names(header)
+    return list(pd.read_excel(uploaded_file, sheet_name=sheet_name, nrows=0).columns)
+
+def read_excel_streaming(uploaded_file, sheet_name, usecols=None):
+    """
+    Reads one sheet of an .xlsx file row by row with openpyxl's read-only mode (see
+    workers.read_worksheet()), so the workbook's full cell object model is never built.
+    `usecols` keeps only those columns (by name); the other cells are skipped as they stream past.
+    """
+    import openpyxl
+    workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+    try:
+        return workers.read_worksheet(workbook[sheet_name], usecols)
+    finally:
+        workbook.close()
+
+def read_excel_sheet(uploaded_file, sheet_name, engine='openpyxl-stream', usecols=None):
+    """
+    Reads a single sheet with the requested engine (see EXCEL_ENGINE_OPTIONS).
+    The streaming engine only handles .xlsx; other files go through pd.read_excel.
+    `usecols` (names from excel_sheet_columns()) restricts the read to those columns.
+    """
+    if engine == 'openpyxl-stream' and OPENPYXL_AVAILABLE and uploaded_file.name.endswith('.xlsx'):
+        return read_excel_streaming(uploaded_file, sheet_name, usecols)
+    if engine == 'calamine' and CALAMINE_AVAILABLE:
+        return pd.read_excel(uploaded_file, sheet_name=sheet_name, engine='calamine', usecols=usecols)
+    return pd.read_excel(uploaded_file, sheet_name=sheet_name, usecols=usecols)
+
+def _format_sheet_option(name, rows, cols):
+    if rows is None or cols is None:
+        return name
+    return f"{name} ({max(rows - 1, 0):,} rows × {cols} columns)" # rows - 1: the header row
+
 def load_excel(uploaded_file):
     """
     Loads an Excel file (XLSX or XLS) into a Pandas DataFrame.
     Asks user to select sheet if multiple sheets are present.
+    Sheet names and sizes are listed without loading any cell data,
+    and only the selected sheet is read. In workbook mode every sheet is
+    profiled instead and the workbook report (see profile_workbook()) is returned.
     """
     try:
-        # Read all sheets to check for multiple sheets
-        xls = pd.ExcelFile(uploaded_file)
-        if len(xls.sheet_names) > 1:
+        # Read the sheet names first to check for multiple sheets
+        sheets = cached_parse(
+            uploaded_file, 'excel_sheets', {},
+            lambda: list_excel_sheets(uploaded_file)
+        )
+        sheet_sizes = {name: (rows, cols) for name, rows, cols in sheets}
+        profile_all_sheets = len(sheets) > 1 and st.sidebar.checkbox(
+            "Profile all sheets (workbook report)",
+            value=False,
+            key=f"workbook_mode_{uploaded_file.name}"
+        )
+        if profile_all_sheets:
+            selected_sheet = None
+        elif len(sheets) > 1:
             selected_sheet = st.sidebar.selectbox(
-                "Select sheet to load:", xls.sheet_names
+                "Select sheet to load:", list(sheet_sizes),
+                format_func=lambda name: _format_sheet_option(name, *sheet_sizes[name])
             )
-            df = pd.read_excel(xls, sheet_name=selected_sheet)
         else:
-            df = pd.read_excel(xls)
+            selected_sheet = sheets[0][0] # First (and only) sheet
+
+        engine_labels = [
+            label for label, engine in EXCEL_ENGINE_OPTIONS.items()
+            if (engine != 'openpyxl-stream' or (OPENPYXL_AVAILABLE and uploaded_file.name.endswith('.xlsx')))
+            and (engine != 'calamine' or CALAMINE_AVAILABLE)
+        ]
+        engine = EXCEL_ENGINE_OPTIONS[st.sidebar.selectbox(
+            "Excel engine:", engine_labels,
+            key=f"excel_engine_{uploaded_file.name}"
+        )]
+        if profile_all_sheets:
+            with st.spinner(f"Profiling {len(sheets)} sheets..."):
+                return cached_parse(
+                    uploaded_file, 'excel_workbook', {'engine': engine},
+                    lambda: profile_workbook(uploaded_file, sheet_sizes, engine)
+                )
+        columns = cached_parse(
+            uploaded_file, 'excel_columns', {'sheet': selected_sheet},
+            lambda: excel_sheet_columns(uploaded_file, selected_sheet),
+            announce=False
+        )
+        usecols = select_columns_sidebar(f"{uploaded_file.name}_{selected_sheet}", columns)
+        df = cached_parse(
+            uploaded_file, 'excel', {'sheet': selected_sheet, 'engine': engine, 'usecols': usecols},
+            lambda: read_excel_sheet(uploaded_file, selected_sheet, engine, usecols)
+        )
         return df
     except Exception as e:
         st.error(f"Error loading Excel file: {e}")
         return None
 
-def extract_from_pdf(uploaded_file, attempt_table_extraction=False):
+# Columnar formats read through PyArrow. Feather v2 and the Arrow IPC file format are the same thing.
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow', '.ipc')
+
+def load_columnar(uploaded_file, columns=None):
+    """
+    Loads a Parquet, Feather or Arrow IPC file into a Pandas DataFrame with Arrow-backed dtypes
+    (see read_columnar()). `columns` restricts the read to those columns; the others are never decoded.
+    """
+    try:
+        return read_columnar(uploaded_file, columns)
+    except Exception as e:
+        suffix = os.path.splitext(uploaded_file.name)[1]
+        st.error(f"Error loading {suffix.lstrip('.').capitalize()} file: {e}")
+        return None
+
+def columnar_column_names(uploaded_file):
+    """
+    Returns the column names of a Parquet, Feather or Arrow IPC file from its schema (no data is read).
+    Returns None if the schema cannot be read.
+    """
+    import pyarrow as pa
+    source = pa.BufferReader(uploaded_file.getbuffer()) # Zero-copy view of the upload
+    try:
+        if uploaded_file.name.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            schema = pq.read_schema(source)
+        else:
+            try:
+                schema = pa.ipc.open_file(source).schema
+            except pa.ArrowInvalid:
+                source.seek(0)
+                schema = pa.ipc.open_stream(source).schema # IPC streaming format
+    except Exception:
+        return None # load_columnar() reports the error
+    return [name for name in schema.names if not name.startswith('__index_level_')] # Skip stored pandas indexes
+
+def read_columnar(uploaded_file, columns=None):
+    """
+    Reads a Parquet, Feather or Arrow IPC file. The upload is spooled to a temporary file and
+    memory-mapped. For uncompressed Feather/IPC the columns are zero-copy views of the mapping,
+    so the OS only reads the pages of the columns a check actually touches; Parquet pages are
+    decoded from the mapping. Raises on error and never calls Streamlit.
+    On Windows the file is read into memory instead: a mapped file cannot be deleted there,
+    so every parse would leave a full-size temporary copy behind.
+    Nested columns (lists, structs, maps) are converted to JSON text (see nested_columns_as_text()).
+    """
+    import pyarrow as pa
+    suffix = os.path.splitext(uploaded_file.name)[1]
+    # On POSIX the mapping stays valid after the temporary file is removed
+    memory_map = os.name != 'nt'
+    with spooled_upload(uploaded_file, suffix=suffix) as path:
+        if suffix == '.parquet':
+            import pyarrow.parquet as pq
+            table = pq.read_table(path, columns=columns, memory_map=memory_map)
+        else:
+            import pyarrow.feather as feather
+            try:
+                table = feather.read_table(path, columns=columns, memory_map=memory_map)
+            except pa.ArrowInvalid:
+                # Not the IPC file format; try the IPC streaming format
+                if memory_map:
+                    table = pa.ipc.open_stream(pa.memory_map(path, 'r')).read_all()
+                else:
+                    with pa.OSFile(path, 'rb') as source: # Closed so the temporary file can be removed
+                        table = pa.ipc.open_stream(source).read_all()
+                if columns is not None:
+                    table = table.select(columns)
+    # types_mapper keeps the Arrow buffers instead of converting every column to NumPy
+    return nested_columns_as_text(table).to_pandas(types_mapper=pd.ArrowDtype)
+
+def nested_columns_as_text(table):
+    """
+    Replaces the nested columns (lists, structs, maps) of an Arrow table with their values as
+    JSON text, e.g. '[1, 2]' or '{"a": 1}'. The checks count and hash values, which nested
+    values do not support; as text they are checked like any other text column.
+    """
+    import pyarrow as pa
+    for position, field in enumerate(table.schema):
+        if pa.types.is_nested(field.type):
+            text = pa.array([
+                None if value is None else json.dumps(value, default=str, ensure_ascii=False)
+                for value in table.column(position).to_pylist()
+            ], type=pa.string())
+            table = table.set_column(position, pa.field(field.name, pa.string()), text)
+    return table
+
+# Camelot settings: 'lattice' for line-separated tables ('stream' for whitespace-separated),
+# with line_scale adjusted for better detection.
+CAMELOT_READ_KWARGS = {'flavor': 'lattice', 'line_scale': 40}
+# Upper bound on pages per Camelot shard; small shards balance the pool and give finer progress.
+PDF_MAX_PAGES_PER_SHARD = 4
+
+def parse_page_range(spec, page_count):
+    """
+    Parses a page range such as '1-5, 8, 10-' (blank means all pages) into sorted page numbers.
+    Raises ValueError for malformed specs or pages outside 1..page_count.
+    """
+    if not spec.strip():
+        return list(range(1, page_count + 1))
+    pages = set()
+    for part in spec.replace(' ', '').split(','):
+        if not part:
+            continue
+        first, dash, last = part.partition('-')
+        first = int(first)
+        last = (int(last) if last else page_count) if dash else first
+        if not 1 <= first <= last <= page_count:
+            raise ValueError(f"'{part}' is outside pages 1-{page_count}")
+        pages.update(range(first, last + 1))
+    return sorted(pages)
+
+def pdf_page_shards(pages, worker_count, max_pages_per_shard=PDF_MAX_PAGES_PER_SHARD):
+    """
+    Splits sorted page numbers into contiguous (first, last) ranges, aiming for a few
+    shards per worker so that slow pages don't leave the other workers idle.
+    """
+    shard_size = max(1, min(max_pages_per_shard, math.ceil(len(pages) / (worker_count * 4))))
+    shards = []
+    for page in pages:
+        if shards and page == shards[-1][1] + 1 and shards[-1][1] - shards[-1][0] + 1 < shard_size:
+            shards[-1] = (shards[-1][0], page)
+        else:
+            shards.append((page, page))
+    return shards
+
+def is_qualifying_table(df):
+    """
+    Returns True for tables worth analyzing on their own; Camelot also reports single boxes
+    and lines as tables. Continuations of a table may be smaller (see is_continuation_table()).
+    """
+    return df.shape[0] >= 2 and df.shape[1] >= 2
+
+def _header_key(row):
+    # Header cells compared without surrounding whitespace or casing, which extraction varies
+    return [str(value).strip().lower() for value in row]
+
+def is_continuation_table(df, page, first_table, last_table):
+    """
+    Returns True if a table (of any number of rows) continues the group of tables before it,
+    given as the group's first and last (page, DataFrame): it is on the same or the next page, has the same number of columns,
+    and its first row either repeats the group's header or is shown to be data by the
+    numerical columns (see _header_votes()). A first row that may be a header of its own,
+    e.g. in all-text tables, starts a new table instead of being merged in as data.
+    """
+    last_page, last_df = last_table
+    if df.empty or df.shape[1] < 2 or page - last_page > 1 or df.shape[1] != last_df.shape[1]:
+        return False
+    first_row = df.iloc[0].tolist()
+    if _header_key(first_row) == _header_key(first_table[1].iloc[0]):
+        return True
+    data_rows = last_df.iloc[1:21].astype(str).values.tolist()
+    header_votes, data_votes = _header_votes([[str(v) for v in first_row]] + data_rows)
+    return data_votes > header_votes
+
+def group_pdf_tables(tables):
+    """
+    Groups consecutive tables that form one logical table split across pages: each group
+    starts with a qualifying table and takes the tables that continue it (see
+    is_continuation_table()). Returns a list of groups, each a list of indices into `tables`.
+    """
+    groups = []
+    for i, (page, df) in enumerate(tables):
+        if groups and is_continuation_table(df, page, tables[groups[-1][0]], tables[groups[-1][-1]]):
+            groups[-1].append(i)
+        elif is_qualifying_table(df):
+            groups.append([i])
+    return groups
+
+def stitch_pdf_tables(tables):
+    """
+    Concatenates each group from group_pdf_tables() into one DataFrame, dropping header rows
+    repeated on continuation pages. Each group is built with a single pd.concat, so the cost
+    stays linear in the number of pages.
+    Returns a list of dictionaries with 'pages' (first, last) and 'df'.
+    """
+    stitched = []
+    for group in group_pdf_tables(tables):
+        header = _header_key(tables[group[0]][1].iloc[0])
+        parts = [tables[group[0]][1]]
+        for i in group[1:]:
+            df = tables[i][1]
+            parts.append(df.iloc[1:] if _header_key(df.iloc[0]) == header else df)
+        stitched.append({
+            'pages': (tables[group[0]][0], tables[group[-1]][0]),
+            'df': pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0],
+        })
+    return stitched
+
+def run_shards_in_order(func, shard_args, max_workers):
+    """
+    Runs func(*args) for every entry of shard_args and yields (index, result) in order.
+    With more than one worker the shards run in a process pool and each result is yielded
+    as soon as it and all earlier ones are ready. Only a bounded window of shards is in
+    flight, so closing the generator early (e.g. `break`) wastes little work: pending
+    shards are cancelled. `func` must live in workers.py so child processes can import it.
+    shard_args may also be a lazy iterator: each entry is only drawn when its shard is
+    submitted, so whatever it sets up (e.g. shared memory) exists only within the window.
+    """
+    shard_count = len(shard_args) if hasattr(shard_args, '__len__') else None
+    if max_workers == 1 or shard_count == 1:
+        for i, args in enumerate(shard_args):
+            yield i, func(*args)
+        return
+
+    # 'spawn': forking the multi-threaded Streamlit server is unsafe
+    executor = ProcessPoolExecutor(max_workers=min(max_workers, shard_count or max_workers),
+                                   mp_context=multiprocessing.get_context('spawn'))
+    try:
+        shard_args = iter(shard_args)
+        pending = {}
+        finished = {}
+        next_shard = next_yield = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(finished) < 2 * max_workers:
+                args = next(shard_args, None)
+                if args is None:
+                    exhausted = True
+                else:
+                    pending[executor.submit(func, *args)] = next_shard
+                    next_shard += 1
+            if exhausted and next_yield == next_shard:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+            while next_yield in finished:
+                yield next_yield, finished.pop(next_yield)
+                next_yield += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def extract_pdf_tables_parallel(pdf_path, pages, progress_callback=None, max_workers=None, max_tables=0):
+    """
+    Runs Camelot over page shards in a process pool (each page is rasterised and
+    line-detected independently). Returns a list of (page number, DataFrame) in page order.
+    With max_tables > 0, extraction stops once that many logical tables (see group_pdf_tables())
+    are complete in page order; later shards are cancelled and never parsed.
+    progress_callback(pages_done, page_total) is called as shards finish.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    shards = pdf_page_shards(pages, max_workers)
+    shard_args = [
+        (pdf_path, str(first) if first == last else f"{first}-{last}", CAMELOT_READ_KWARGS)
+        for first, last in shards
+    ]
+    tables = []
+    groups = [] # Logical tables found so far
+    pages_done = 0
+    results = run_shards_in_order(workers.extract_pdf_tables, shard_args, max_workers)
+    try:
+        for i, shard_tables in results:
+            tables.extend(shard_tables)
+            groups = group_pdf_tables(tables)
+            pages_done += shards[i][1] - shards[i][0] + 1
+            if progress_callback:
+                progress_callback(pages_done, len(pages))
+            # A table may continue on the next page, so the max_tables-th one is only known to be
+            # complete once another table has started after it, or no page left to scan follows its last page
+            if max_tables > 0 and len(groups) >= max_tables:
+                last_page = tables[groups[max_tables - 1][-1]][0]
+                if len(groups) > max_tables:
+                    return tables[:groups[max_tables][0]] # Drop the table that started after the last wanted one
+                if i + 1 == len(shards) or shards[i + 1][0] > last_page + 1:
+                    return tables
+    finally:
+        results.close() # Cancels shards that are no longer needed
+    return tables
+
+def extract_from_pdf(uploaded_file, attempt_table_extraction=False, page_range='', max_tables=0):
     """
     Attempts to extract tables from PDF using Camelot if requested,
     falls back to text extraction if no tables are found or Camelot is not available/requested.
+    Only the pages in page_range (e.g. '1-5, 8'; blank for all) are scanned, and scanning
+    stops after max_tables tables (0 scans every page); tables continued across pages are joined.
     Returns a dictionary with 'type' ('dataframe' or 'text') and 'content'.
     """
-    if attempt_table_extraction and camelot:
+    if attempt_table_extraction and CAMELOT_AVAILABLE:
+        import PyPDF2 # Used to count pages; imported on first use
         try:
-            # Camelot expects a file path, so we need to save the uploaded file temporarily
-            # or pass it as a BytesIO object if camelot supports it (it prefers paths).
-            # Camelot's read_pdf can take a file-like object directly.
-            tables = camelot.read_pdf(uploaded_file, pages='all', flavor='lattice', # 'lattice' for line-separated tables, 'stream' for whitespace-separated
-                                      line_scale=40) # Adjust line_scale for better detection
-
-            if tables.n > 0:
-                st.success(f"✅ Found {tables.n} table(s) in the PDF using Camelot.")
-                # For simplicity, we'll return the first table found as a DataFrame
-                # You could extend this to allow selection of multiple tables.
-                return {'type': 'dataframe', 'content': tables[0].df}
+            # Camelot expects a file path, so the upload is saved to a temporary file
+            # that every worker process can open.
+            with spooled_upload(uploaded_file, suffix='.pdf') as pdf_path:
+                page_count = len(PyPDF2.PdfReader(pdf_path).pages)
+                try:
+                    pages = parse_page_range(page_range, page_count)
+                except ValueError as e:
+                    st.warning(f"Invalid page range ({e}). Scanning all {page_count} page(s) instead.")
+                    pages = list(range(1, page_count + 1))
+                progress = st.progress(0.0, text=f"Extracting tables from {len(pages)} page(s)...")
+                tables = extract_pdf_tables_parallel(
+                    pdf_path, pages,
+                    progress_callback=lambda done, total: progress.progress(
+                        done / total, text=f"Extracting tables: {done}/{total} page(s) processed"
+                    ),
+                    max_tables=max_tables
+                )
+                progress.empty()
+
+            stitched = stitch_pdf_tables(tables)
+            if not stitched and tables:
+                # Only boxes/lines were detected; keep them rather than discarding everything
+                stitched = [{'pages': (page, page), 'df': df} for page, df in tables]
+            if stitched:
+                st.success(f"✅ Found {len(tables)} table(s) in the PDF using Camelot, forming {len(stitched)} table(s) after joining tables continued across pages.")
+                # 'content' is the first table; the sidebar lets the user pick another one
+                return {'type': 'dataframe', 'content': stitched[0]['df'], 'tables': stitched}
             else:
                 st.info("No tables found using Camelot. Attempting basic text extraction.")
                 text_content = extract_text_from_pdf_basic(uploaded_file)
@@ -92,8 +949,10 @@ def extract_from_pdf(uploaded_file, attempt_table_extraction=False):
             else:
                 return {'type': 'none', 'content': None}
     else:
-        if attempt_table_extraction and not camelot:
-             st.warning("Camelot is not installed or configured. Cannot attempt table extraction. Falling back to basic PDF text extraction.")
+        if attempt_table_extraction and not CAMELOT_AVAILABLE:
+            st.error("Camelot library not found. Please install it using: pip install 'camelot-py[cv]'")
+            st.error("Also, ensure Ghostscript is installed and in your system's PATH. See https://camelot-py.readthedocs.io/en/master/user/install-deps.html for details.")
+            st.warning("Camelot is not installed or configured. Cannot attempt table extraction. Falling back to basic PDF text extraction.")
 
         text_content = extract_text_from_pdf_basic(uploaded_file)
         if text_content:
@@ -101,57 +960,227 @@ def extract_from_pdf(uploaded_file, attempt_table_extraction=False):
         else:
             return {'type': 'none', 'content': None}
 
+# PDFs with fewer pages are read in-process; starting worker processes costs more than it saves.
+PDF_TEXT_PARALLEL_MIN_PAGES = 50
+# Pages per text-extraction shard; text extraction is cheap per page, so shards are larger than Camelot's.
+PDF_TEXT_PAGES_PER_SHARD = 25
+# Pages shown while the rest of the document is still being extracted.
+PDF_TEXT_PREVIEW_PAGES = 3
+
+def iter_pdf_text_pages(pdf_path, page_count, max_workers=None):
+    """
+    Yields (page number, text) for every page in page order. Large documents are split into
+    page shards extracted in a process pool; earlier pages are yielded while later shards
+    are still being processed.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if page_count < PDF_TEXT_PARALLEL_MIN_PAGES:
+        max_workers = 1
+    shards = pdf_page_shards(list(range(1, page_count + 1)), max_workers, PDF_TEXT_PAGES_PER_SHARD)
+    results = run_shards_in_order(workers.extract_pdf_text, [(pdf_path, first, last) for first, last in shards], max_workers)
+    try:
+        for i, texts in results:
+            yield from enumerate(texts, start=shards[i][0])
+    finally:
+        results.close()
+
 def extract_text_from_pdf_basic(uploaded_file):
     """
     Extracts text content from a PDF file using PyPDF2.
     This is a fallback for when Camelot doesn't find tables or is not available.
+    Pages are gathered in a list and joined once; the first pages are previewed
+    while the rest are still being extracted.
     """
     try:
-        # Reset file pointer for PyPDF2 after Camelot might have read it
-        uploaded_file.seek(0)
-        reader = PyPDF2.PdfReader(uploaded_file)
-        text = ""
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            text += page.extract_text() + "\n"
-        return text
+        import PyPDF2 # Imported on first use; worker processes import it themselves
+        with spooled_upload(uploaded_file, suffix='.pdf') as pdf_path:
+            page_count = len(PyPDF2.PdfReader(pdf_path).pages)
+            progress = st.progress(0.0, text=f"Extracting text from {page_count} page(s)...")
+            preview = st.empty()
+            pages = []
+            for page_number, page_text in iter_pdf_text_pages(pdf_path, page_count):
+                pages.append(page_text)
+                progress.progress(page_number / page_count, text=f"Extracting text: {page_number}/{page_count} page(s)")
+                if len(pages) <= PDF_TEXT_PREVIEW_PAGES:
+                    preview.text("\n".join(pages)) # Show the first pages straight away
+            progress.empty()
+            preview.empty()
+        return "".join(f"{page_text}\n" for page_text in pages)
     except Exception as e:
         st.error(f"Error extracting text from PDF with PyPDF2: {e}.")
         return None
 
 # --- Data Upload Function (Sidebar) ---
 
+def _format_pdf_table_option(index, table):
+    first, last = table['pages']
+    pages = f"page {first}" if first == last else f"pages {first}-{last}"
+    return f"Table {index + 1} ({pages}, {len(table['df'])} rows)"
+
 def data_upload_sidebar():
     """
-    Handles single file upload in the Streamlit sidebar.
+    Handles file upload in the Streamlit sidebar.
     Returns a tuple: (filename, DataFrame/text_content) or (None, None).
+    When several files are uploaded they are profiled as a batch (see profile_batch()).
     """
     st.sidebar.header("1. Upload Your Data")
-    uploaded_file = st.sidebar.file_uploader(
-        "Upload a CSV, TSV, Excel (.xlsx/.xls), or PDF file",
-        type=["csv", "tsv", "xlsx", "xls", "pdf"],
-        accept_multiple_files=False # Limit to single file upload
+    uploaded_files = st.sidebar.file_uploader(
+        "Upload CSV, TSV (optionally .gz/.bz2/.xz/.zst compressed), Excel (.xlsx/.xls), Parquet, Feather/Arrow, or PDF files",
+        type=["csv", "tsv", "gz", "bz2", "xz", "zst", "xlsx", "xls", "parquet", "feather", "arrow", "ipc", "pdf"],
+        accept_multiple_files=True # Several files are profiled together as a batch
     )
 
+    if len(uploaded_files) > 1:
+        st.sidebar.write(f"**Processing:** {len(uploaded_files)} files (batch mode)")
+        return f"{len(uploaded_files)} files", profile_batch(uploaded_files)
+
+    uploaded_file = uploaded_files[0] if uploaded_files else None
     if uploaded_file:
         file_name = uploaded_file.name
         st.sidebar.write(f"**Processing:** {file_name}")
 
         # Determine file type and load accordingly
-        if file_name.endswith(('.csv', '.tsv')):
+        base_name, compression = split_compression(file_name)
+        if compression and not base_name.endswith(('.csv', '.tsv')):
+            st.error("Only CSV/TSV files can be uploaded compressed (e.g. `data.csv.gz`).")
+            return None, None
+        if compression == 'zstd' and importlib.util.find_spec("zstandard") is None:
+            st.error("Reading .zst files requires the zstandard package. Please install it using: pip install zstandard")
+            return None, None
+
+        if base_name.endswith(('.csv', '.tsv')):
+            sample = read_sample(uploaded_file, compression=compression)
+            encoding = detect_encoding(sample)
+            dialect = sniff_dialect(sample, encoding, default_delimiter='\t' if base_name.endswith('.tsv') else ',')
+            delimiter_labels = list(DELIMITER_OPTIONS)
             delimiter_option = st.sidebar.radio(
                 f"Select delimiter for {file_name}:",
-                ('Comma (,)', 'Tab (\t)'),
+                delimiter_labels,
+                index=list(DELIMITER_OPTIONS.values()).index(dialect['delimiter']), # Pre-select the sniffed delimiter
                 key=f"delimiter_{file_name}"
             )
-            delimiter = ',' if delimiter_option == 'Comma (,)' else '\t'
-            df = load_csv_tsv(uploaded_file, delimiter)
+            has_header = st.sidebar.checkbox(
+                "First row contains column names",
+                value=dialect['has_header'],
+                key=f"has_header_{file_name}"
+            )
+            st.sidebar.caption(f"Detected encoding: `{encoding}`, quote character: `{dialect['quotechar']}`")
+            read_options = {
+                'delimiter': DELIMITER_OPTIONS[delimiter_option],
+                'encoding': encoding,
+                'quotechar': dialect['quotechar'],
+                'header': 'infer' if has_header else None,
+                'compression': compression,
+            }
+            columns = cached_parse(
+                uploaded_file, 'csv_columns', read_options,
+                lambda: csv_column_names(uploaded_file, **read_options),
+                announce=False
+            )
+            read_options['usecols'] = select_columns_sidebar(file_name, columns)
+            fast_estimate = st.sidebar.checkbox(
+                "Fast estimate for very large files (analyzes a random sample)",
+                value=False,
+                help="Counts are scaled up from the sample with 95% confidence intervals. You can rerun the analysis exactly afterwards.",
+                key=f"fast_estimate_{file_name}"
+            )
+            if fast_estimate:
+                with st.spinner("Sampling rows..."):
+                    estimate_result = cached_parse(
+                        uploaded_file, 'csv_estimate', read_options,
+                        lambda: analyze_csv_estimate(uploaded_file, **read_options)
+                    )
+                if estimate_result is not None:
+                    return file_name, estimate_result
+                return None, None
+            streaming_mode = st.sidebar.checkbox(
+                "Streaming mode for large files (analysis only, reads in chunks)",
+                value=False,
+                key=f"streaming_{file_name}"
+            )
+            if streaming_mode:
+                chunk_rows = st.sidebar.number_input(
+                    "Rows per chunk:",
+                    min_value=1_000,
+                    value=STREAMING_CHUNK_ROWS,
+                    step=10_000,
+                    key=f"chunk_rows_{file_name}"
+                )
+                with st.spinner("Analyzing file in chunks..."):
+                    stream_result = cached_parse(
+                        uploaded_file, 'csv_stream', {**read_options, 'chunksize': chunk_rows},
+                        lambda: analyze_csv_streaming(uploaded_file, chunksize=chunk_rows, **read_options)
+                    )
+                if stream_result is not None:
+                    return file_name, stream_result
+                return None, None
+            engine, arrow_dtypes = 'c', False
+            if PYARROW_AVAILABLE:
+                engine_option = st.sidebar.selectbox(
+                    "CSV parser engine:",
+                    ('pandas (default)', 'PyArrow (multithreaded)'),
+                    key=f"csv_engine_{file_name}"
+                )
+                if engine_option == 'PyArrow (multithreaded)':
+                    engine = 'pyarrow'
+                    arrow_dtypes = st.sidebar.checkbox(
+                        "Keep Arrow-backed data types (lower memory)",
+                        value=False,
+                        key=f"arrow_dtypes_{file_name}"
+                    )
+            dtype_plan = None
+            if not arrow_dtypes: # Arrow-backed dtypes are already compact
+                plan_memory = st.sidebar.checkbox(
+                    "Plan compact data types from a sample (lower memory)",
+                    value=True,
+                    help="Low-cardinality text is loaded as categories and numbers in the smallest type that holds them.",
+                    key=f"dtype_plan_{file_name}"
+                )
+                if plan_memory:
+                    dtype_plan = cached_parse(
+                        uploaded_file, 'csv_dtype_plan', read_options,
+                        lambda: plan_csv_dtypes(uploaded_file, **read_options),
+                        announce=False
+                    )
+            csv_params = {**read_options, 'engine': engine, 'arrow_dtypes': arrow_dtypes, 'dtype_plan': dtype_plan is not None}
+            df = cached_parse(
+                uploaded_file, 'csv', csv_params,
+                lambda: load_csv_tsv(uploaded_file, engine=engine, arrow_dtypes=arrow_dtypes, dtype_plan=dtype_plan, **read_options)
+            )
             if df is not None:
+                if dtype_plan is not None:
+                    report = cached_parse(
+                        uploaded_file, 'csv_memory_report', csv_params,
+                        lambda: memory_saving_report(dtype_plan, df),
+                        announce=False
+                    )
+                    st.sidebar.caption(
+                        f"🗜️ Compact data types: estimated {report['estimated_saving']:.0%} less memory "
+                        f"(from a {dtype_plan['sample_rows']:,}-row sample). Loaded {format_bytes(report['actual_bytes'])} "
+                        f"vs ~{format_bytes(report['projected_default_bytes'])} with inferred types "
+                        f"({report['actual_saving']:.0%} less)."
+                    )
                 return file_name, df
         elif file_name.endswith(('.xlsx', '.xls')):
             df = load_excel(uploaded_file)
             if df is not None:
                 return file_name, df
+        elif file_name.endswith(COLUMNAR_EXTENSIONS):
+            if not PYARROW_AVAILABLE:
+                st.error("PyArrow is required for Parquet, Feather and Arrow files. Please install it using: pip install pyarrow")
+                return None, None
+            columns = cached_parse(
+                uploaded_file, 'columnar_columns', {},
+                lambda: columnar_column_names(uploaded_file),
+                announce=False
+            )
+            selected_columns = select_columns_sidebar(file_name, columns)
+            df = cached_parse(
+                uploaded_file, 'columnar', {'columns': selected_columns},
+                lambda: load_columnar(uploaded_file, selected_columns)
+            )
+            if df is not None:
+                return file_name, df
         elif file_name.endswith('.pdf'):
             # Option to attempt table extraction for PDF
             attempt_table_extraction = st.sidebar.checkbox(
@@ -159,8 +1188,34 @@ def data_upload_sidebar():
                 value=True, # Default to true for convenience
                 key=f"pdf_extract_option_{file_name}"
             )
-            pdf_data = extract_from_pdf(uploaded_file, attempt_table_extraction)
+            page_range, max_tables = '', 0
+            if attempt_table_extraction:
+                page_range = st.sidebar.text_input(
+                    "Pages to scan for tables (e.g. 1-5, 8; leave blank for all):",
+                    value="",
+                    key=f"pdf_page_range_{file_name}"
+                )
+                max_tables = st.sidebar.number_input(
+                    "Stop after this many tables (0 = scan every page):",
+                    min_value=0,
+                    value=0,
+                    help="A table continued across pages counts once.",
+                    key=f"pdf_max_tables_{file_name}"
+                )
+            pdf_data = cached_parse(
+                uploaded_file, 'pdf', {'tables': attempt_table_extraction, 'pages': page_range, 'max_tables': max_tables},
+                lambda: extract_from_pdf(uploaded_file, attempt_table_extraction, page_range, max_tables)
+            )
             if pdf_data['type'] == 'dataframe':
+                tables = pdf_data['tables']
+                if len(tables) > 1:
+                    table_index = st.sidebar.selectbox(
+                        "Select table to analyze:",
+                        range(len(tables)),
+                        format_func=lambda i: _format_pdf_table_option(i, tables[i]),
+                        key=f"pdf_table_{file_name}"
+                    )
+                    return file_name, tables[table_index]['df']
                 return file_name, pdf_data['content']
             elif pdf_data['type'] == 'text':
                 return file_name, pdf_data['content']
@@ -168,14 +1223,395 @@ def data_upload_sidebar():
                 return None, None # No content extracted
     return None, None # No file uploaded or error
 
+# --- Column Statistics Engine (shared by the summary, the checks and auto-clean) ---
+
+class ColumnStatistics:
+    """
+    Per-column statistics of one DataFrame, each computed at most once and then shared by
+    display_column_summary(), compute_quality_findings() and auto_clean_dataframe().
+
+    A single value_counts() per column answers the missing count, the distinct values, the
+    number of unique values, the mode, the most frequent values and the repeated values,
+    which used to be separate full scans. Numerical statistics come from one pass as well.
+    Duplicate detection and deduplication share one hash index per column and one 64-bit hash
+    per row, so the rows are hashed once rather than by every duplicated()/drop_duplicates().
+    Only a weak reference to the DataFrame is kept, so the statistics never keep a dataset alive.
+    """
+
+    def __init__(self, df):
+        self._df = weakref.ref(df)
+        self._columns = {} # col -> {statistic name: value}
+        self._row_hashes = None
+        self._duplicated_rows = None
+
+    def _frame(self):
+        df = self._df()
+        if df is None:
+            raise ReferenceError("The DataFrame these statistics describe no longer exists.")
+        return df
+
+    def _column(self, col):
+        return self._columns.setdefault(col, {})
+
+    def seed(self, col, statistics):
+        """
+        Stores statistics computed elsewhere (see profile_columns_parallel()), keyed like the cache.
+        """
+        self._column(col).update(statistics)
+
+    def profiled(self, col):
+        """
+        True once the column's value counts, and with them its missing count, are known.
+        """
+        return 'value_counts' in self._columns.get(col, {})
+
+    def invalidate(self, col):
+        """
+        Forgets a column's statistics after the column was changed in place.
+        """
+        self._columns.pop(col, None)
+        self._row_hashes = None
+        self._duplicated_rows = None
+
+    def column_codes(self, col):
+        """
+        The column's hash index: one integer code per row (pandas.factorize), equal for rows
+        whose values duplicated() considers equal, with every missing value sharing code -1.
+        """
+        stats = self._column(col)
+        if 'codes' not in stats:
+            stats['codes'] = pd.factorize(self._frame()[col])[0]
+        return stats['codes']
+
+    def row_hashes(self):
+        """
+        A 64-bit hash of each row, combined from the columns' hash indexes. Two rows share
+        a hash when all their values are equal (distinct rows colliding is vanishingly unlikely).
+        """
+        if self._row_hashes is None:
+            df = self._frame()
+            codes = pd.DataFrame({position: self.column_codes(col) for position, col in enumerate(df.columns)})
+            self._row_hashes = pd.util.hash_pandas_object(codes, index=False).to_numpy()
+        return self._row_hashes
+
+    def duplicated_rows(self):
+        """
+        Boolean array marking each row that repeats an earlier row, as DataFrame.duplicated().
+        """
+        if self._duplicated_rows is None:
+            self._duplicated_rows = pd.Series(self.row_hashes()).duplicated().to_numpy()
+        return self._duplicated_rows
+
+    def duplicate_rows(self):
+        """
+        Number of rows that repeat an earlier row.
+        """
+        return int(self.duplicated_rows().sum())
+
+    def duplicate_row_groups(self, limit):
+        """
+        Up to `limit` groups of identical rows, in order of first appearance, each a list of
+        row positions.
+        """
+        hashes = self.row_hashes()
+        positions = np.flatnonzero(pd.Series(hashes).duplicated(keep=False).to_numpy())
+        groups = pd.Series(positions).groupby(hashes[positions], sort=False).agg(list)
+        return groups.head(limit).tolist()
+
+    def duplicated_values(self, col, rows=None):
+        """
+        Boolean array marking each row whose value in `col` repeats an earlier row's, as
+        duplicated(subset=[col]). `rows` restricts the check to those row positions (in order).
+        """
+        codes = self.column_codes(col)
+        if rows is not None:
+            codes = codes[rows]
+        return pd.Series(codes).duplicated().to_numpy()
+
+    def value_counts(self, col):
+        """
+        Counts of the column's non-missing values, most frequent first. Also records the missing count.
+        """
+        stats = self._column(col)
+        if 'value_counts' not in stats:
+            stats['missing'], stats['value_counts'] = workers.count_values(self._frame()[col])
+        return stats['value_counts']
+
+    def missing(self, col):
+        stats = self._column(col)
+        if 'missing' not in stats: # Cheaper than value_counts() when nothing else is needed
+            stats['missing'] = int(self._frame()[col].isna().sum())
+        return stats['missing']
+
+    def non_null(self, col):
+        return len(self._frame()) - self.missing(col)
+
+    def nunique(self, col):
+        return len(self.value_counts(col))
+
+    def mode(self, col):
+        """
+        The most frequent value(s), sorted as in Series.mode().
+        """
+        counts = self.value_counts(col)
+        if counts.empty:
+            return []
+        modes = counts.index[counts == counts.iloc[0]]
+        try:
+            modes = modes.sort_values()
+        except TypeError:
+            pass # Mixed types in an object column cannot be ordered
+        return modes.tolist()
+
+    def repeated_values(self, col):
+        """
+        Values that occur more than once, in order of their first repeat (missing included,
+        as Series.duplicated() counts it).
+        """
+        series = self._frame()[col]
+        return series[self.duplicated_values(col)].unique().tolist()
+
+    def numeric_coercion(self, col):
+        """
+        How well a text column parses as numbers (see workers.numeric_coercion()).
+        """
+        stats = self._column(col)
+        if 'numeric_coercion' not in stats:
+            stats['numeric_coercion'], stats['distinct_numbers'] = workers.numeric_coercion(self.value_counts(col))
+        return stats['numeric_coercion']
+
+    def numeric_values(self, col):
+        """
+        The column converted as workers.to_numeric_coerce() would (values that do not parse
+        become missing), expanded from the distinct values' conversion instead of parsing
+        every row again.
+        """
+        stats = self._column(col)
+        if 'numeric_values' not in stats:
+            self.numeric_coercion(col)
+            series = self._frame()[col]
+            codes = self.value_counts(col).index.get_indexer(series) # -1 for missing values
+            numbers = stats['distinct_numbers']
+            if (codes < 0).any():
+                numbers = np.append(numbers.astype('float64'), np.nan) # Code -1 picks the trailing NaN
+            stats['numeric_values'] = pd.Series(numbers[codes], index=series.index, name=series.name)
+        return stats['numeric_values']
+
+    def text_consistency(self, col):
+        """
+        Whitespace and casing checks of a text column (see workers.text_consistency()).
+        """
+        stats = self._column(col)
+        if 'text_consistency' not in stats:
+            stats['text_consistency'] = workers.text_consistency(self.value_counts(col))
+        return stats['text_consistency']
+
+    def date_formats(self, col):
+        """
+        The date formats of a text column (see workers.infer_date_formats()), or None if it holds no dates.
+        """
+        stats = self._column(col)
+        if 'date_formats' not in stats:
+            stats['date_formats'] = workers.infer_date_formats(self.value_counts(col))
+        return stats['date_formats']
+
+    def distribution(self, col):
+        """
+        Min and max of a numerical or date column; numerical columns also get the mean,
+        standard deviation, median and quartiles (one quantile() call for all three).
+        """
+        stats = self._column(col)
+        if 'distribution' not in stats:
+            series = self._frame()[col]
+            distribution = {'min': series.min(), 'max': series.max()}
+            if pd.api.types.is_numeric_dtype(series):
+                distribution['mean'] = series.mean()
+                distribution['std'] = series.std()
+                if pd.api.types.is_bool_dtype(series):
+                    distribution['median'] = series.median() # Booleans have a median but no quantiles
+                else:
+                    q1, median, q3 = self.quartiles([col])[col]
+                    distribution.update({'q1': q1, 'median': median, 'q3': q3})
+            stats['distribution'] = distribution
+        return stats['distribution']
+
+    def quartiles(self, columns):
+        """
+        (Q1, median, Q3) of each numerical (non-boolean) column, as {col: tuple}. Columns not
+        seen yet are computed together in one DataFrame.quantile() call instead of one per column.
+        """
+        pending = [col for col in columns if 'quartiles' not in self._column(col)]
+        if pending:
+            quantiles = self._frame()[pending].quantile([0.25, 0.5, 0.75])
+            for position, col in enumerate(pending):
+                self._column(col)['quartiles'] = tuple(quantiles.iloc[:, position].tolist())
+        return {col: self._column(col)['quartiles'] for col in columns}
+
+    def outliers(self, columns):
+        """
+        IQR outliers of each numerical (non-boolean) column, as {col: {'count', 'examples'} or None}.
+        Columns not seen yet are compared against their bounds in blocks, one 2-D operation each.
+        """
+        pending = [col for col in columns if 'outliers' not in self._column(col)]
+        quartiles = self.quartiles(pending) # One quantile() call for every column
+        lower_bounds = np.empty(len(pending))
+        upper_bounds = np.empty(len(pending))
+        for position, col in enumerate(pending):
+            Q1, _, Q3 = quartiles[col]
+            lower_bounds[position], upper_bounds[position] = workers.iqr_bounds(Q1, Q3)
+
+        # Missing values become NaN, which compares False, as fillna(False) did per column
+        df = self._frame()
+        block_columns = max(1, OUTLIER_BLOCK_CELLS // max(len(df), 1))
+        for start in range(0, len(pending), block_columns):
+            block = df[pending[start:start + block_columns]]
+            values = block.to_numpy(dtype='float64', na_value=np.nan)
+            bounds = slice(start, start + block.shape[1])
+            is_outlier = (values < lower_bounds[bounds]) | (values > upper_bounds[bounds])
+            for position, col in enumerate(block.columns):
+                rows = np.flatnonzero(is_outlier[:, position])
+                self._column(col)['outliers'] = {
+                    'count': len(rows),
+                    'examples': block.iloc[rows[:5], position].tolist() # Show first 5 examples
+                } if len(rows) else None
+        return {col: self._column(col)['outliers'] for col in columns}
+
+class StatisticsRegistry:
+    """
+    Maps each DataFrame to its ColumnStatistics for as long as the DataFrame exists.
+    Parsed uploads are reused across reruns (see cached_parse()), so their statistics are too.
+    """
+
+    def __init__(self):
+        self._stats = {} # id(df) -> ColumnStatistics; DataFrames are not hashable
+        self._lock = threading.Lock() # Sessions run in separate threads but share this registry
+
+    def get(self, df):
+        with self._lock:
+            stats = self._stats.get(id(df))
+            if stats is None or stats._df() is not df:
+                stats = ColumnStatistics(df)
+                self._stats[id(df)] = stats
+                weakref.finalize(df, self._discard, id(df), stats)
+            return stats
+
+    def _discard(self, key, stats):
+        with self._lock:
+            if self._stats.get(key) is stats:
+                del self._stats[key]
+
+@st.cache_resource
+def get_statistics_registry():
+    """
+    Returns the process-wide statistics registry.
+    """
+    return StatisticsRegistry()
+
+def column_statistics(df):
+    """
+    Returns the shared ColumnStatistics of a DataFrame, creating it on first use. Large
+    DataFrames have their columns profiled in parallel first (see profile_columns_parallel()).
+    """
+    stats = get_statistics_registry().get(df)
+    profile_columns_parallel(df, stats)
+    return stats
+
+# --- Parallel Column Profiling ---
+
+# DataFrames with fewer cells are profiled in-process: starting the workers would take longer.
+PARALLEL_PROFILE_MIN_CELLS = 5_000_000
+
+def share_column(series):
+    """
+    Writes a column to a new shared memory block as an Arrow IPC stream, for workers.profile_column().
+    Returns the block, or None if Arrow cannot represent the column (e.g. mixed types in an object column).
+    """
+    import pyarrow as pa
+
+    try:
+        table = pa.Table.from_pandas(series.to_frame(name='values'), preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+    def write(sink):
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    size = pa.MockOutputStream() # Measures the stream, so it can be written straight into the block
+    write(size)
+    block = shared_memory.SharedMemory(create=True, size=size.size())
+    buffer = pa.py_buffer(block.buf)
+    write(pa.FixedSizeBufferWriter(buffer))
+    del buffer # The block cannot be closed while a view of it exists
+    return block
+
+def profile_columns_parallel(df, stats, max_workers=None):
+    """
+    Computes the per-column statistics of the quality checks (value counts, missing counts,
+    the hash index used for duplicate rows, quartiles and IQR outliers of numerical columns,
+    and the whitespace/casing, numeric-coercion and date-format checks of text columns)
+    for every column not profiled yet, one column per task in a process pool, and seeds
+    `stats` with them. Columns reach the workers through shared memory rather than
+    pickled copies; a column's blocks are only created once its task enters the pool's
+    bounded window (see run_shards_in_order()) and are freed as soon as its result is
+    seeded, so shared memory holds a few columns at a time, never the whole DataFrame.
+    Does nothing on a single CPU, without pyarrow or for small DataFrames; columns Arrow
+    cannot represent are left to be computed in-process on first use.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or not PYARROW_AVAILABLE or df.size < PARALLEL_PROFILE_MIN_CELLS or df.columns.has_duplicates:
+        return
+    pending = [col for col in df.columns if not stats.profiled(col)]
+    if not pending:
+        return
+
+    def release(*blocks):
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    shards = [] # (column, table block, codes block) per task; None once its result is seeded
+
+    def shard_args():
+        # Drawn by run_shards_in_order() as tasks are submitted, so blocks are created lazily
+        for col in pending:
+            table_block = share_column(df[col])
+            if table_block is None:
+                continue
+            try:
+                codes_block = shared_memory.SharedMemory(create=True, size=len(df) * 8) # One int64 code per row
+            except OSError:
+                release(table_block)
+                raise
+            shards.append((col, table_block, codes_block))
+            yield table_block.name, codes_block.name, len(df)
+
+    results = run_shards_in_order(workers.profile_column, shard_args(), max_workers)
+    try:
+        for i, profile in results:
+            col, table_block, codes_block = shards[i]
+            codes = np.ndarray(len(df), dtype=np.int64, buffer=codes_block.buf)
+            profile['codes'] = codes.copy()
+            del codes # The block cannot be closed while a view of it exists
+            shards[i] = None
+            release(table_block, codes_block)
+            stats.seed(col, profile)
+    except (OSError, BrokenProcessPool) as e:
+        # The statistics not seeded yet are computed in-process on first use
+        st.warning(f"Parallel column profiling failed ({e}); continuing in a single process.")
+    finally:
+        results.close()
+        for shard in shards:
+            if shard is not None:
+                release(*shard[1:])
+
 # --- Data Quality Analysis Functions ---
 
-def analyze_dataframe_quality(df_name, df):
+def empty_findings():
     """
-    Analyzes a Pandas DataFrame for common data quality issues.
-    Returns a dictionary of findings.
+    Returns an empty findings dictionary with every issue category present.
     """
-    findings = {
+    return {
         "missing_values": {},
         "duplicate_rows_count": 0,
         "inconsistent_categorical": {},
@@ -183,41 +1619,152 @@ def analyze_dataframe_quality(df_name, df):
         "whitespace_issues": {},
         "outliers": {}, # New: For numerical outliers
         "uniqueness_violations": {}, # New: For columns that should be unique
-        "date_format_inconsistencies": {} # New: For mixed date formats
+        "date_format_inconsistencies": {}, # New: For mixed date formats
+        "categorical_variants": {}, # Details for inconsistent_categorical: which values collide, rows per variant
+        "numeric_coercion": {}, # Details for incorrect_datatypes: how many values parse as numbers
+        "date_formats": {}, # Details for date_format_inconsistencies: rows per detected format
+        "duplicate_row_groups": [] # Details for duplicate_rows_count: row labels of identical rows, per group
     }
 
+# Findings entries that detail another category's issues rather than flag issues of their own.
+FINDING_DETAIL_KEYS = ("categorical_variants", "numeric_coercion", "date_formats", "duplicate_row_groups")
+# Groups of identical rows kept in findings["duplicate_row_groups"], in order of first appearance.
+DUPLICATE_ROW_GROUPS = 5
+# Cells per 2-D outlier comparison; wider frames are compared in blocks of columns to bound memory.
+OUTLIER_BLOCK_CELLS = 20_000_000
+
+def describe_date_format(date_format):
+    """
+    Turns a strftime format into a readable pattern, e.g. '%d/%m/%Y' -> 'DD/MM/YYYY'.
+    """
+    if date_format == workers.ISO_DATE_FORMAT:
+        return 'ISO 8601 (other)'
+    for code, label in (('%Y', 'YYYY'), ('%y', 'YY'), ('%m', 'MM'), ('%d', 'DD'), ('%H', 'hh'),
+                        ('%M', 'mm'), ('%S', 'ss'), ('%b', 'Mon'), ('%B', 'Month')):
+        date_format = date_format.replace(code, label)
+    return date_format
+
+def text_columns(df):
+    """
+    Returns the names of the object/string columns of a DataFrame.
+    """
+    return [col for col in df.columns if workers.is_text_column(df[col])]
+
+def potential_id_columns(columns):
+    """
+    Returns the columns that look like identifiers and should therefore be unique.
+    This check assumes columns named 'ID', 'id', 'staffid', 'employeeid' etc. should be unique.
+    For a more robust app, you'd let the user specify unique key columns.
+    """
+    return [col for col in columns if 'id' in str(col).lower()]
+
+def analyze_dataframe_quality(df_name, df):
+    """
+    Analyzes a Pandas DataFrame for common data quality issues.
+    Returns a dictionary of findings.
+    """
+    findings = compute_quality_findings(df)
+    render_quality_report(
+        df_name, findings,
+        numeric_columns_found=not df.select_dtypes(include=['number']).columns.empty
+    )
+    return findings
+
+def compute_quality_findings(df, stats=None):
+    """
+    Runs every data quality check on a DataFrame without rendering anything.
+    `stats` defaults to the DataFrame's shared ColumnStatistics (see column_statistics()).
+    Returns a dictionary of findings (see empty_findings()).
+    """
+    findings = empty_findings()
+    stats = stats or column_statistics(df)
+
+    # 1. Missing Values
+    for col in df.columns:
+        if stats.missing(col) > 0:
+            findings["missing_values"][col] = stats.missing(col)
+
+    # 2. Duplicate Rows (entire row duplicates)
+    findings["duplicate_rows_count"] = stats.duplicate_rows()
+    if findings["duplicate_rows_count"] > 0:
+        findings["duplicate_row_groups"] = [
+            df.index[group].tolist() for group in stats.duplicate_row_groups(DUPLICATE_ROW_GROUPS)
+        ]
+
+    # 3. Inconsistent Categorical Values (e.g., casing, extra spaces)
+    # Iterate through object/string columns to check for inconsistencies
+    for col in text_columns(df):
+        whitespace_rows, whitespace_values, groups, group_count = stats.text_consistency(col)
+        # Check for leading/trailing spaces
+        if whitespace_rows:
+            findings["whitespace_issues"][col] = f"Leading/trailing whitespace detected in {whitespace_rows} row(s) ({whitespace_values} distinct value(s))."
+        # Check for casing inconsistencies (after stripping whitespace)
+        if groups:
+            findings["inconsistent_categorical"][col] = f"Casing or other minor variations detected (e.g., 'Male' vs 'male'): {group_count} value(s) written in more than one way."
+            findings["categorical_variants"][col] = groups
+
+    # 4. Incorrect Data Types (basic check: numbers as objects)
+    for col in text_columns(df):
+        # Check if a numerical column is stored as object type. The conversion always changes a
+        # text column's dtype, so any value that parses as a number flags it.
+        coercion = stats.numeric_coercion(col)
+        if coercion['parsed'] > 0:
+            findings["incorrect_datatypes"][col] = "Numerical data stored as object/string type."
+            findings["numeric_coercion"][col] = coercion
+
+    # 5. Outlier Detection (for numerical columns using IQR)
+    numeric_columns = list(df.select_dtypes(include=['number']).columns)
+    for col, outliers in stats.outliers(numeric_columns).items():
+        if outliers:
+            findings["outliers"][col] = outliers
+
+    # 6. Uniqueness Violations (for columns that might be unique, like IDs)
+    for col in potential_id_columns(df.columns):
+        duplicate_ids = stats.repeated_values(col)
+        if duplicate_ids:
+            findings["uniqueness_violations"][col] = {
+                "count": len(duplicate_ids),
+                "examples": duplicate_ids
+            }
+
+    # 7. Date Format Inconsistencies (basic check)
+    for col in text_columns(df):
+        # Detect the formats used (columns without date-like text are skipped)
+        date_formats = stats.date_formats(col)
+        if date_formats is None or not date_formats['formats']:
+            continue
+        # Several formats, or values that are not dates in any format, make the column inconsistent
+        if len(date_formats['formats']) > 1 or date_formats['unparsed'] > 0:
+            findings["date_format_inconsistencies"][col] = (
+                f"Mixed or invalid date formats detected: {len(date_formats['formats'])} format(s), "
+                f"{date_formats['unparsed']} value(s) not a valid date."
+            )
+            findings["date_formats"][col] = date_formats
+
+    return findings
+
+def render_quality_report(df_name, findings, numeric_columns_found=True):
+    """
+    Displays the data quality findings produced by compute_quality_findings().
+    """
     st.subheader(f"Data Quality Report for: `{df_name}`")
 
     # 1. Missing Values
-    missing_counts = df.isnull().sum()
-    missing_cols = missing_counts[missing_counts > 0]
-    if not missing_cols.empty:
+    if findings["missing_values"]:
         st.warning("⚠️ Missing Values Detected!")
-        st.dataframe(missing_cols.to_frame(name='Missing Count'))
-        findings["missing_values"] = missing_cols.to_dict()
+        st.dataframe(pd.Series(findings["missing_values"], dtype='int64').to_frame(name='Missing Count'))
     else:
         st.success("✅ No missing values found.")
 
     # 2. Duplicate Rows (entire row duplicates)
-    duplicate_rows = df.duplicated().sum()
-    if duplicate_rows > 0:
-        st.warning(f"⚠️ {duplicate_rows} duplicate row(s) detected!")
-        findings["duplicate_rows_count"] = duplicate_rows
+    if findings["duplicate_rows_count"] > 0:
+        st.warning(f"⚠️ {findings['duplicate_rows_count']} duplicate row(s) detected!")
+        for group in findings["duplicate_row_groups"]:
+            st.write(f"   - Rows {', '.join(str(label) for label in group)} are identical.")
     else:
         st.success("✅ No duplicate rows found.")
 
     # 3. Inconsistent Categorical Values (e.g., casing, extra spaces)
-    # Iterate through object/string columns to check for inconsistencies
-    for col in df.select_dtypes(include=['object']).columns:
-        unique_values = df[col].dropna().astype(str).unique()
-        # Check for leading/trailing spaces
-        if any(val != val.strip() for val in unique_values):
-            findings["whitespace_issues"][col] = "Leading/trailing whitespace detected."
-        # Check for casing inconsistencies (after stripping whitespace)
-        cleaned_unique_values = {val.strip().lower() for val in unique_values}
-        if len(cleaned_unique_values) < len(unique_values):
-            findings["inconsistent_categorical"][col] = "Casing or other minor variations detected (e.g., 'Male' vs 'male')."
-
     if findings["inconsistent_categorical"] or findings["whitespace_issues"]:
         st.warning("⚠️ Potential Inconsistencies in Categorical/Text Data:")
         if findings["whitespace_issues"]:
@@ -228,16 +1775,16 @@ def analyze_dataframe_quality(df_name, df):
             st.write("   - **Value Inconsistencies (Casing/Variations):**")
             for col, issue in findings["inconsistent_categorical"].items():
                 st.write(f"     - Column `{col}`: {issue}")
+                groups = findings["categorical_variants"].get(col)
+                if groups:
+                    st.dataframe(pd.DataFrame([
+                        {'Value': group['value'], 'Written As': f"'{raw}'", 'Rows': rows} # Quoted so stray spaces show
+                        for group in groups for raw, rows in group['variants'].items()
+                    ]), hide_index=True)
     else:
         st.success("✅ Categorical/text data appears consistent (no obvious casing/whitespace issues).")
 
     # 4. Incorrect Data Types (basic check: numbers as objects)
-    for col in df.columns:
-        # Check if a numerical column is stored as object type
-        if pd.api.types.is_object_dtype(df[col]) and pd.to_numeric(df[col], errors='coerce').notna().any():
-            if not pd.to_numeric(df[col], errors='coerce').equals(df[col]): # Check if conversion changes values
-                findings["incorrect_datatypes"][col] = "Numerical data stored as object/string type."
-
     if findings["incorrect_datatypes"]:
         st.warning("⚠️ Potential Incorrect Data Types:")
         for col, issue in findings["incorrect_datatypes"].items():
@@ -246,47 +1793,17 @@ def analyze_dataframe_quality(df_name, df):
         st.success("✅ Data types appear appropriate for most columns.")
 
     # 5. Outlier Detection (for numerical columns using IQR)
-    numerical_cols = df.select_dtypes(include=['number']).columns
-    if not numerical_cols.empty:
-        outlier_detected = False
-        for col in numerical_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col]
-            if not outliers.empty:
-                findings["outliers"][col] = {
-                    "count": len(outliers),
-                    "examples": outliers.head(5).tolist() # Show first 5 examples
-                }
-                outlier_detected = True
-        if outlier_detected:
-            st.warning("⚠️ Potential Outliers Detected in Numerical Data:")
-            for col, info in findings["outliers"].items():
-                st.write(f"   - Column `{col}`: {info['count']} outlier(s) detected (e.g., {info['examples']}).")
-        else:
-            st.success("✅ No obvious outliers detected in numerical columns (using IQR method).")
-    else:
+    if not numeric_columns_found:
         st.info("No numerical columns found for outlier detection.")
+    elif findings["outliers"]:
+        st.warning("⚠️ Potential Outliers Detected in Numerical Data:")
+        for col, info in findings["outliers"].items():
+            st.write(f"   - Column `{col}`: {info['count']} outlier(s) detected (e.g., {info['examples']}).")
+    else:
+        st.success("✅ No obvious outliers detected in numerical columns (using IQR method).")
 
     # 6. Uniqueness Violations (for columns that might be unique, like IDs)
-    # This check assumes columns named 'ID', 'id', 'staffid', 'employeeid' etc. should be unique.
-    # For a more robust app, you'd let the user specify unique key columns.
-    potential_id_cols = [col for col in df.columns if 'id' in str(col).lower()]
-    uniqueness_violation_found = False
-    for col in potential_id_cols:
-        if df[col].duplicated().any():
-            duplicate_ids = df[col][df[col].duplicated()].unique()
-            findings["uniqueness_violations"][col] = {
-                "count": len(duplicate_ids),
-                "examples": duplicate_ids.tolist()
-            }
-            uniqueness_violation_found = True
-
-    if uniqueness_violation_found:
+    if findings["uniqueness_violations"]:
         st.warning("⚠️ Potential Uniqueness Violations Detected:")
         for col, info in findings["uniqueness_violations"].items():
             st.write(f"   - Column `{col}` (potential ID): {info['count']} duplicate ID(s) found (e.g., {info['examples']}).")
@@ -294,26 +1811,828 @@ def analyze_dataframe_quality(df_name, df):
         st.success("✅ No obvious uniqueness violations found in potential ID columns.")
 
     # 7. Date Format Inconsistencies (basic check)
-    date_inconsistency_found = False
-    for col in df.select_dtypes(include=['object']).columns:
-        # Attempt to convert to datetime, coercing errors
-        temp_series = pd.to_datetime(df[col], errors='coerce')
-        # If there are non-null values that couldn't be converted, it suggests mixed formats
-        if temp_series.isnull().sum() > 0 and temp_series.notnull().any():
-            # Check if all non-null original values could be parsed
-            if not df[col][temp_series.isnull()].isnull().all():
-                findings["date_format_inconsistencies"][col] = "Mixed or invalid date formats detected."
-                date_inconsistency_found = True
-
-    if date_inconsistency_found:
+    if findings["date_format_inconsistencies"]:
         st.warning("⚠️ Potential Date Format Inconsistencies:")
         for col, issue in findings["date_format_inconsistencies"].items():
             st.write(f"   - Column `{col}`: {issue}")
+            date_formats = findings["date_formats"].get(col)
+            if date_formats:
+                distribution = [
+                    {'Format': describe_date_format(date_format), 'Rows': rows}
+                    for date_format, rows in date_formats['formats'].items()
+                ]
+                if date_formats['unparsed']:
+                    distribution.append({'Format': 'Not a valid date', 'Rows': date_formats['unparsed']})
+                st.dataframe(pd.DataFrame(distribution), hide_index=True)
     else:
         st.success("✅ Date formats appear consistent or no date columns found.")
 
+# --- Streaming (Chunked) Analysis for Large CSV/TSV ---
 
-    return findings
+# Rows read per chunk in streaming mode; peak memory scales with this, not the file size.
+STREAMING_CHUNK_ROWS = 100_000
+# Values kept per numerical column to estimate Q1/Q3. Columns with fewer values get exact quartiles.
+STREAMING_QUANTILE_SAMPLE = 200_000
+
+# Text pd.read_csv reads as booleans, compared lowercased.
+BOOLEAN_STRINGS = ('true', 'false')
+
+class HashSet64:
+    """
+    A set of 64-bit hashes kept as a few sorted NumPy arrays (8 bytes per distinct hash).
+    Each add() stores its new hashes as a sorted run; a run is merged into the one before it
+    once it has grown to half that run's size, so there are O(log n) runs to search.
+    """
+
+    def __init__(self):
+        self._runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, hashes):
+        """
+        Boolean array marking the hashes that are in the set.
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[positions] == hashes
+        return found
+
+    def add(self, hashes):
+        """
+        Adds hashes to the set. Returns a boolean array marking the ones that were already in
+        the set or occur earlier in `hashes`, as Series.duplicated() would across all adds.
+        """
+        unique, first = np.unique(hashes, return_index=True)
+        is_new = ~self.contains(unique)
+        repeated = np.ones(len(hashes), dtype=bool)
+        repeated[first[is_new]] = False
+        if is_new.any():
+            self._runs.append(unique[is_new])
+            while len(self._runs) > 1 and 2 * len(self._runs[-1]) >= len(self._runs[-2]):
+                newer = self._runs.pop()
+                self._runs[-1] = np.sort(np.concatenate([self._runs[-1], newer]))
+        return repeated
+
+def _restore_number(value, integer):
+    """
+    Converts a parsed float back to the type pandas would have given the column.
+    """
+    return int(value) if integer else float(value)
+
+class StreamingQualityAnalyzer:
+    """
+    Computes the same findings as compute_quality_findings() from a stream of DataFrame chunks.
+
+    Chunks must be read with dtype=str so every chunk sees the raw text; column types are
+    inferred across the whole stream the way pd.read_csv would (numeric if every non-empty
+    value parses as a number). Each check keeps a small mergeable partial result per column:
+    counts, rows per date format (workers.infer_date_formats() on each chunk's distinct values), a
+    bounded random sample for the IQR quartiles, and sets of 64-bit hashes (see HashSet64) of
+    the distinct rows, of the distinct ID values and of the distinct text values and their
+    normalized forms. Those sets are the one cost that grows with the file: 8 bytes per
+    distinct row, ID or text value, never the text itself. The outlier, ID, casing-variant and
+    duplicate-row examples need a second pass over the file once the whole-file quartiles,
+    duplicated IDs, colliding values and repeated rows are known. Columns of only
+    'True'/'False' are booleans, as pd.read_csv reads them, and skip the text checks.
+    """
+
+    def __init__(self, quantile_sample=STREAMING_QUANTILE_SAMPLE, seed=0):
+        self.quantile_sample = quantile_sample
+        self._rng = np.random.default_rng(seed)
+        self.columns = None
+        self.rows = 0
+        self._distinct_rows = HashSet64()
+        self._duplicate_rows = 0
+        self._duplicate_row_hashes = HashSet64() # Distinct rows seen more than once
+        self._missing = {}
+        self._nonnull = {}
+        self._numeric = {} # Values that parse as numbers
+        self._integer = {} # Whether every numeric value so far is a whole number
+        self._boolean = {} # Values that pd.read_csv reads as booleans ('True', 'false', ...)
+        self._whitespace_rows = {}
+        self._whitespace_values = {} # Distinct values with leading/trailing whitespace
+        self._text_values = {} # col -> HashSet64 of the distinct raw text values
+        self._normalized_values = {} # col -> HashSet64 of their stripped, lowercased forms
+        self._variant_groups = {} # col -> HashSet64 of normalized forms written more than one way
+        self._date_formats = {} # col -> {format: rows}
+        self._date_unparsed = {} # Non-missing rows no date format matches
+        self._date_skipped = {} # Non-missing rows in chunks without date-like text
+        self._samples = {} # col -> (values, random keys) reservoir of numeric values
+        self._id_values = {} # col -> HashSet64 of the distinct ID values
+        self._duplicate_id_hashes = {} # col -> HashSet64 of the ID values seen more than once
+        # Filled in by prepare_second_pass()
+        self._bounds = {}
+        self._outliers = {}
+        self._duplicate_ids = {}
+        self._seen_ids = {}
+        self._variants = {} # col -> rows per raw value of the colliding normalized forms
+        self._duplicate_row_groups = {} # row hash -> row labels, for the first few duplicated rows
+
+    def consume(self, chunk):
+        """
+        First pass: folds one chunk into the partial results of every check.
+        """
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            for col in self.columns:
+                for partial in (self._missing, self._nonnull, self._numeric, self._boolean, self._whitespace_rows,
+                                self._whitespace_values, self._date_unparsed, self._date_skipped):
+                    partial[col] = 0
+                self._integer[col] = True
+                self._date_formats[col] = {}
+                self._text_values[col] = HashSet64()
+                self._normalized_values[col] = HashSet64()
+                self._variant_groups[col] = HashSet64()
+                self._samples[col] = (np.empty(0), np.empty(0))
+            for col in potential_id_columns(self.columns):
+                self._id_values[col] = HashSet64()
+                self._duplicate_id_hashes[col] = HashSet64()
+
+        self.rows += len(chunk)
+        for col in self.columns:
+            series = chunk[col]
+            nonnull = series.dropna()
+            self._missing[col] += len(series) - len(nonnull)
+            self._nonnull[col] += len(nonnull)
+
+            parsed = pd.to_numeric(nonnull, errors='coerce')
+            is_number = parsed.notna()
+            numbers = parsed[is_number].to_numpy(dtype='float64')
+            self._numeric[col] += len(numbers)
+            if self._integer[col] and len(numbers):
+                self._integer[col] = bool(np.all(np.mod(numbers, 1) == 0))
+            self._update_sample(col, numbers)
+
+            # The text checks work on the chunk's distinct values, as on a loaded column
+            counts = nonnull.value_counts(sort=False)
+            if len(counts):
+                is_boolean = counts.index.str.lower().isin(BOOLEAN_STRINGS)
+                self._boolean[col] += int(counts.to_numpy()[is_boolean].sum())
+                self._update_text(col, counts)
+                self._update_dates(col, counts)
+
+            if col in self._id_values:
+                hashes = pd.util.hash_array(series.to_numpy(dtype=object))
+                repeated = self._id_values[col].add(hashes)
+                self._duplicate_id_hashes[col].add(hashes[repeated])
+
+        row_hashes = self._row_hashes(chunk)
+        repeated = self._distinct_rows.add(row_hashes)
+        self._duplicate_rows += int(repeated.sum())
+        self._duplicate_row_hashes.add(row_hashes[repeated])
+
+    def _row_hashes(self, chunk):
+        """
+        64-bit hash of each row's text, with boolean values lowercased so that rows pd.read_csv
+        reads as equal (e.g. 'True' and 'true') hash alike.
+        """
+        boolean_columns = [col for col in self.columns if self._boolean[col]]
+        if boolean_columns:
+            chunk = chunk.copy(deep=False)
+            for col in boolean_columns:
+                lowered = chunk[col].str.lower()
+                chunk[col] = chunk[col].where(~lowered.isin(BOOLEAN_STRINGS), lowered)
+        return pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+
+    def _update_sample(self, col, numbers):
+        """
+        Keeps a uniform random sample of the column's numeric values (priority sampling:
+        every value gets a random key and the smallest keys are kept).
+        """
+        values, keys = self._samples[col]
+        if values is None or not len(numbers):
+            return
+        values = np.concatenate([values, numbers])
+        keys = np.concatenate([keys, self._rng.random(len(numbers))])
+        if len(values) > self.quantile_sample:
+            keep = np.argpartition(keys, self.quantile_sample)[:self.quantile_sample]
+            values, keys = values[keep], keys[keep]
+        self._samples[col] = (values, keys)
+
+    def _update_text(self, col, counts):
+        """
+        Counts rows and new distinct values with leading/trailing whitespace, and records
+        normalized forms (stripped, lowercased) that two different raw values share,
+        comparing hashes so the text itself is never kept. Plain numbers have no casing and
+        are not hashed, so numerical columns add nothing to the sets.
+        """
+        values = pd.Series(counts.index.astype(str), dtype=object)
+        stripped = values.str.strip()
+        has_whitespace = (values != stripped).to_numpy()
+        self._whitespace_rows[col] += int(counts.to_numpy()[has_whitespace].sum())
+        tracked = has_whitespace | workers.to_numeric_coerce(values).isna().to_numpy()
+        values, stripped, has_whitespace = values[tracked], stripped[tracked], has_whitespace[tracked]
+        is_new = ~self._text_values[col].add(pd.util.hash_array(values.to_numpy()))
+        self._whitespace_values[col] += int((has_whitespace & is_new).sum())
+        normalized = stripped[is_new].str.lower()
+        normalized_hashes = pd.util.hash_array(normalized.to_numpy(dtype=object))
+        # A new raw value whose normalized form was already seen is another way of writing it
+        collides = self._normalized_values[col].add(normalized_hashes)
+        self._variant_groups[col].add(normalized_hashes[collides])
+
+    def _update_dates(self, col, counts):
+        """
+        Adds the chunk's rows per date format, as workers.infer_date_formats() finds them in its distinct values.
+        """
+        date_formats = workers.infer_date_formats(counts)
+        if date_formats is None:
+            # No date-like text in this chunk: its rows only count as invalid dates if other chunks have dates
+            self._date_skipped[col] += int(counts.sum())
+            return
+        for date_format, rows in date_formats['formats'].items():
+            self._date_formats[col][date_format] = self._date_formats[col].get(date_format, 0) + rows
+        self._date_unparsed[col] += date_formats['unparsed']
+
+    def is_numeric_column(self, col):
+        return self._numeric[col] == self._nonnull[col]
+
+    def is_boolean_column(self, col):
+        # pd.read_csv reads columns of only 'True'/'False' (any casing) as booleans, not text
+        return self._nonnull[col] > 0 and self._boolean[col] == self._nonnull[col]
+
+    def is_integer_column(self, col):
+        # pandas only keeps an integer dtype when there are no missing values
+        return self.is_numeric_column(col) and self._integer[col] and self._missing[col] == 0
+
+    def prepare_second_pass(self):
+        """
+        Computes IQR bounds, duplicated ID hashes and colliding text values from the first pass.
+        Returns True if a second pass over the file is needed for examples.
+        """
+        for col in self.columns:
+            values = self._samples[col][0]
+            if self.is_numeric_column(col) and len(values):
+                q1, q3 = np.quantile(values, [0.25, 0.75])
+                iqr = q3 - q1
+                self._bounds[col] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+                self._outliers[col] = {"count": 0, "examples": []}
+            self._samples[col] = (None, None) # Free the samples
+
+        self._duplicate_id_hashes = {col: hashes for col, hashes in self._duplicate_id_hashes.items() if len(hashes)}
+        self._duplicate_ids = {col: {} for col in self._duplicate_id_hashes} # hash -> value, in order of first repeat
+        self._seen_ids = {col: set() for col in self._duplicate_id_hashes} # Duplicated ID hashes met once so far
+        self._id_values = {} # Free the distinct ID hashes
+        self._variants = {
+            col: pd.Series(dtype='int64') for col in self.columns
+            if len(self._variant_groups[col]) and not self.is_numeric_column(col) and not self.is_boolean_column(col)
+        }
+        self._distinct_rows = HashSet64() # Free the distinct row hashes
+        return bool(self._bounds or self._duplicate_id_hashes or self._variants or len(self._duplicate_row_hashes))
+
+    def consume_second_pass(self, chunk):
+        """
+        Second pass: counts outliers against the whole-file bounds and collects example values,
+        the rows per variant of each colliding text value and the first groups of identical rows.
+        """
+        if len(self._duplicate_row_hashes):
+            row_hashes = self._row_hashes(chunk)
+            is_duplicate = self._duplicate_row_hashes.contains(row_hashes)
+            groups = self._duplicate_row_groups
+            for row_hash, label in zip(row_hashes[is_duplicate].tolist(), chunk.index[is_duplicate].tolist()):
+                if row_hash in groups:
+                    groups[row_hash].append(label)
+                elif len(groups) < DUPLICATE_ROW_GROUPS:
+                    groups[row_hash] = [label]
+
+        for col, (lower, upper) in self._bounds.items():
+            numbers = pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype='float64')
+            outliers = numbers[(numbers < lower) | (numbers > upper)]
+            info = self._outliers[col]
+            info["count"] += len(outliers)
+            for value in outliers[:5 - len(info["examples"])]:
+                info["examples"].append(_restore_number(value, self.is_integer_column(col)))
+
+        for col, duplicate_hashes in self._duplicate_id_hashes.items():
+            values = chunk[col].to_numpy(dtype=object)
+            hashes = pd.util.hash_array(values)
+            is_duplicate = duplicate_hashes.contains(hashes)
+            examples, seen = self._duplicate_ids[col], self._seen_ids[col]
+            for value_hash, value in zip(hashes[is_duplicate].tolist(), values[is_duplicate]):
+                if value_hash in seen:
+                    examples.setdefault(value_hash, value)
+                else:
+                    seen.add(value_hash)
+
+        for col, variants in self._variants.items():
+            counts = chunk[col].dropna().value_counts(sort=False)
+            values = pd.Series(counts.index.astype(str), dtype=object)
+            normalized = values.str.strip().str.lower()
+            collides = self._variant_groups[col].contains(pd.util.hash_array(normalized.to_numpy()))
+            if collides.any():
+                self._variants[col] = variants.add(
+                    pd.Series(counts.to_numpy()[collides], index=values[collides].to_numpy()), fill_value=0
+                ).astype('int64')
+
+    def findings(self):
+        """
+        Returns the findings dictionary, in the same schema as compute_quality_findings().
+        """
+        findings = empty_findings()
+        if self.columns is None:
+            return findings
+
+        findings["missing_values"] = {col: count for col, count in self._missing.items() if count > 0}
+        findings["duplicate_rows_count"] = self._duplicate_rows
+        findings["duplicate_row_groups"] = list(self._duplicate_row_groups.values())
+
+        for col in self.columns:
+            if self.is_numeric_column(col):
+                continue # Text checks only apply to object columns
+            if self.is_boolean_column(col):
+                if self._missing[col]:
+                    # With missing values pandas keeps the booleans in an object column, where they convert to numbers
+                    findings["incorrect_datatypes"][col] = "Numerical data stored as object/string type."
+                    findings["numeric_coercion"][col] = {'parsed': self._nonnull[col], 'unparsed': 0, 'ratio': 1.0}
+                continue
+            if self._whitespace_rows[col]:
+                findings["whitespace_issues"][col] = (
+                    f"Leading/trailing whitespace detected in {self._whitespace_rows[col]} row(s) "
+                    f"({self._whitespace_values[col]} distinct value(s))."
+                )
+            if col in self._variants:
+                group_count = len(self._variant_groups[col])
+                findings["inconsistent_categorical"][col] = f"Casing or other minor variations detected (e.g., 'Male' vs 'male'): {group_count} value(s) written in more than one way."
+                findings["categorical_variants"][col] = workers.text_consistency(self._variants[col])[2]
+            if self._numeric[col] > 0:
+                findings["incorrect_datatypes"][col] = "Numerical data stored as object/string type."
+                findings["numeric_coercion"][col] = {
+                    'parsed': self._numeric[col],
+                    'unparsed': self._nonnull[col] - self._numeric[col],
+                    'ratio': self._numeric[col] / self._nonnull[col],
+                }
+            formats = self._date_formats[col]
+            if formats:
+                # Chunks without date-like text hold values that are not dates in any format
+                unparsed = self._date_unparsed[col] + self._date_skipped[col]
+                if len(formats) > 1 or unparsed > 0:
+                    findings["date_format_inconsistencies"][col] = (
+                        f"Mixed or invalid date formats detected: {len(formats)} format(s), "
+                        f"{unparsed} value(s) not a valid date."
+                    )
+                    findings["date_formats"][col] = {
+                        'formats': dict(sorted(formats.items(), key=lambda item: -item[1])),
+                        'unparsed': unparsed,
+                    }
+
+        findings["outliers"] = {col: info for col, info in self._outliers.items() if info["count"] > 0}
+
+        for col, examples in self._duplicate_ids.items():
+            values = list(examples.values())
+            if self.is_numeric_column(col):
+                values = [v if pd.isna(v) else _restore_number(float(v), self.is_integer_column(col)) for v in values]
+            findings["uniqueness_violations"][col] = {"count": len(values), "examples": values}
+        return findings
+
+def read_csv_chunks(uploaded_file, fold, chunksize=STREAMING_CHUNK_ROWS, delimiter=',',
+                    encoding='utf-8', quotechar='"', header='infer', compression=None, usecols=None):
+    """
+    Reads a CSV/TSV file as chunks of raw text (dtype=str) and returns (fold(chunks), encoding),
+    where chunks iterates over the file's DataFrame chunks. If a byte beyond the sniffed sample
+    does not decode, fold() is called again on chunks read from the start as latin1, so it must
+    build its result from scratch. The encoding that worked is returned for later passes.
+    """
+    def read_chunks(encoding):
+        uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file, delimiter=delimiter, quotechar=quotechar, header=header, usecols=usecols,
+                           dtype=str, encoding=encoding, compression=compression, chunksize=chunksize)
+
+    try:
+        return fold(read_chunks(encoding)), encoding
+    except UnicodeDecodeError:
+        # A byte beyond the sniffed sample did not decode: start over reading with 'latin1'
+        return fold(read_chunks('latin1')), 'latin1'
+
+def analyze_csv_streaming(uploaded_file, chunksize=STREAMING_CHUNK_ROWS, **read_options):
+    """
+    Analyzes a CSV/TSV file chunk by chunk without loading it fully into memory.
+    Returns a dictionary with the findings, a preview of the first rows and the file's shape.
+    `read_options` are those of read_csv_chunks(); `usecols` restricts the analysis to
+    those columns, the others are never parsed.
+    """
+    def first_pass(chunks):
+        analyzer = StreamingQualityAnalyzer()
+        preview = None
+        for chunk in chunks:
+            if preview is None:
+                preview = chunk.head()
+            analyzer.consume(chunk)
+        return analyzer, preview
+
+    def second_pass(chunks):
+        for chunk in chunks:
+            analyzer.consume_second_pass(chunk)
+
+    try:
+        (analyzer, preview), encoding = read_csv_chunks(uploaded_file, first_pass, chunksize, **read_options)
+        if analyzer.prepare_second_pass():
+            read_csv_chunks(uploaded_file, second_pass, chunksize, **dict(read_options, encoding=encoding))
+
+        return {
+            'type': 'stream',
+            'findings': analyzer.findings(),
+            'preview': preview,
+            'rows': analyzer.rows,
+            'columns': len(analyzer.columns or []),
+            'numeric_columns_found': any(analyzer.is_numeric_column(col) for col in analyzer.columns or []),
+        }
+    except Exception as e:
+        st.error(f"Error analyzing CSV/TSV in streaming mode: {e}")
+        return None
+
+# --- Fast Estimate (Sample-Based) Analysis for Large CSV/TSV ---
+
+# Rows kept in the reservoir sample that fast-estimate mode analyzes.
+ESTIMATE_SAMPLE_ROWS = 100_000
+# z-score of the confidence intervals reported for estimated counts (95%).
+ESTIMATE_CONFIDENCE_Z = 1.96
+# Smallest row hashes kept to estimate the file's number of distinct rows (about 1% error at 95%).
+ESTIMATE_DISTINCT_SKETCH = 65_536
+
+def sample_csv_rows(uploaded_file, sample_rows=ESTIMATE_SAMPLE_ROWS, chunksize=STREAMING_CHUNK_ROWS, seed=0, **read_options):
+    """
+    Draws a uniform random sample of rows from a CSV/TSV file in one streaming pass.
+    Bottom-k reservoir sampling: each row gets an independent random key and the rows with
+    the smallest keys are kept, so memory is bounded by the sample size. The keys come from
+    a generator seeded with `seed`, so rerunning on the same file draws the same sample.
+    The same pass keeps the smallest distinct row hashes (see estimate_distinct_rows()),
+    since the sample alone cannot tell how many rows of the file are duplicates.
+    `read_options` are those of read_csv_chunks().
+    Returns (sample with dtypes inferred as pd.read_csv would, total rows, preview of the first rows,
+    distinct rows as (estimate, lower bound, upper bound)).
+    """
+    def draw(chunks):
+        rng = np.random.default_rng(seed) # Fresh on a latin1 start-over, so the sample is the same
+        sample, keys, preview, rows = None, np.empty(0), None, 0
+        row_hashes = np.empty(0, dtype='uint64') # Smallest distinct row hashes, ascending
+        for chunk in chunks:
+            if preview is None:
+                preview = chunk.head()
+            rows += len(chunk)
+            chunk_hashes = pd.util.hash_pandas_object(chunk, index=False, categorize=False).to_numpy() # Mostly unique text: factorizing first would only add work
+            if len(row_hashes) == ESTIMATE_DISTINCT_SKETCH:
+                chunk_hashes = chunk_hashes[chunk_hashes < row_hashes[-1]]
+            row_hashes = np.unique(np.concatenate([row_hashes, chunk_hashes]))[:ESTIMATE_DISTINCT_SKETCH]
+            chunk_keys = rng.random(len(chunk))
+            if len(keys) >= sample_rows: # Reservoir full: only rows below the current largest key can enter
+                below = chunk_keys < keys.max()
+                chunk, chunk_keys = chunk[below], chunk_keys[below]
+            sample = chunk if sample is None else pd.concat([sample, chunk], ignore_index=True)
+            keys = np.concatenate([keys, chunk_keys])
+            if len(keys) > sample_rows:
+                keep = np.sort(np.argpartition(keys, sample_rows)[:sample_rows]) # Sorted: keep file order
+                sample, keys = sample.iloc[keep].reset_index(drop=True), keys[keep]
+        return sample, rows, preview, row_hashes
+
+    (sample, rows, preview, row_hashes), _ = read_csv_chunks(uploaded_file, draw, chunksize, **read_options)
+    if sample is None:
+        return pd.DataFrame(), 0, None, (0, 0, 0)
+
+    # The sample was read as text; re-parse it so columns get the dtypes a full load would infer
+    columns = sample.columns
+    sample = pd.read_csv(io.StringIO(sample.to_csv(index=False)))
+    sample.columns = columns
+    return sample, rows, preview, estimate_distinct_rows(row_hashes, rows)
+
+def estimate_distinct_rows(row_hashes, population_rows, z=ESTIMATE_CONFIDENCE_Z):
+    """
+    Estimates a file's number of distinct rows from its smallest distinct 64-bit row hashes
+    (a k-minimum-values sketch): k hashes spread uniformly over [0, 2**64) reach about
+    k / distinct of the range. Returns (estimate, lower bound, upper bound), exact when the
+    file has fewer distinct rows than the sketch holds.
+    """
+    k = len(row_hashes)
+    if k < ESTIMATE_DISTINCT_SKETCH:
+        return k, k, k
+    estimate = (k - 1) / ((float(row_hashes[-1]) + 1) / 2.0 ** 64)
+    margin = z / math.sqrt(k - 2) # Relative standard error of the estimate
+    lower = max(estimate * (1 - margin), k)
+    upper = min(estimate * (1 + margin), population_rows)
+    return min(estimate, population_rows), lower, upper
+
+def estimate_count(sample_count, sample_rows, population_rows, z=ESTIMATE_CONFIDENCE_Z):
+    """
+    Scales a count observed in a uniform sample up to the whole file.
+    Returns (estimate, lower bound, upper bound) of a Wilson score interval with a finite
+    population correction; the bounds never contradict what the sample itself shows.
+    """
+    if sample_rows >= population_rows or sample_rows == 0:
+        return sample_count, sample_count, sample_count # The sample is the whole file
+    n, N = sample_rows, population_rows
+    p = sample_count / n
+    z2 = z * z * (N - n) / (N - 1) # Finite population correction on the variance
+    denominator = 1 + z2 / n
+    center = (p + z2 / (2 * n)) / denominator
+    half_width = math.sqrt(z2 * (p * (1 - p) / n + z2 / (4 * n * n))) / denominator
+    lower = max((center - half_width) * N, sample_count)
+    upper = min((center + half_width) * N, N - (n - sample_count))
+    return p * N, lower, upper
+
+def estimate_quality_findings(sample, population_rows, distinct_rows):
+    """
+    Runs every check on a row sample and scales the counts (missing values, outliers) to the
+    whole file; duplicate rows come from the file's estimated distinct rows instead (see
+    estimate_distinct_rows()), since the sample's share of duplicates does not scale.
+    Returns (findings, intervals): findings in the usual schema
+    with estimated counts, and one row per estimated count with its confidence interval.
+    Column-level flags (whitespace, casing, data types, dates, IDs) come from the sample as is,
+    so issues rarer than about one row in the sample can be missed.
+    """
+    findings = compute_quality_findings(sample, ColumnStatistics(sample))
+    sample_rows = len(sample)
+    intervals = []
+
+    def scale(check, col, count):
+        estimate, lower, upper = estimate_count(int(count), sample_rows, population_rows)
+        intervals.append({'Check': check, 'Column': col, 'In Sample': int(count),
+                          'Estimate': round(estimate), '95% CI Low': math.floor(lower), '95% CI High': math.ceil(upper)})
+        return round(estimate)
+
+    findings["missing_values"] = {
+        col: scale("Missing values", col, count) for col, count in findings["missing_values"].items()
+    }
+    sample_duplicates = findings["duplicate_rows_count"]
+    distinct, distinct_lower, distinct_upper = distinct_rows
+    findings["duplicate_rows_count"] = round(population_rows - distinct)
+    intervals.append({'Check': "Duplicate rows", 'Column': '', 'In Sample': int(sample_duplicates),
+                      'Estimate': findings["duplicate_rows_count"],
+                      '95% CI Low': math.floor(population_rows - distinct_upper),
+                      '95% CI High': math.ceil(population_rows - distinct_lower)})
+    findings["duplicate_row_groups"] = [] # Positions in the sample do not identify rows of the file
+    for col, info in findings["outliers"].items():
+        info["count"] = scale("Outliers", col, info["count"])
+    return findings, intervals
+
+def analyze_csv_estimate(uploaded_file, sample_rows=ESTIMATE_SAMPLE_ROWS, **read_options):
+    """
+    Fast-estimate analysis: samples rows in one streaming pass (see sample_csv_rows()) and
+    runs all checks on the sample. Returns a dictionary with the estimated findings, their
+    confidence intervals, a preview and the file's shape.
+    """
+    try:
+        sample, rows, preview, distinct_rows = sample_csv_rows(uploaded_file, sample_rows, **read_options)
+        findings, intervals = estimate_quality_findings(sample, rows, distinct_rows)
+        return {
+            'type': 'estimate',
+            'findings': findings,
+            'intervals': intervals,
+            'preview': preview,
+            'rows': rows,
+            'sample_rows': len(sample),
+            'columns': len(sample.columns),
+            'numeric_columns_found': not sample.select_dtypes(include=['number']).columns.empty,
+        }
+    except Exception as e:
+        st.error(f"Error analyzing CSV/TSV in fast-estimate mode: {e}")
+        return None
+
+def promote_to_exact(file_name):
+    """
+    Button callback: turns fast-estimate mode off for this file so the next run is exact.
+    Runs before the rerun, when widget state may still be changed.
+    """
+    st.session_state[f"fast_estimate_{file_name}"] = False
+
+# --- Whole-Workbook Profiling ---
+
+def count_issues(findings):
+    """
+    Returns the number of flagged issues (columns per category, plus duplicate rows).
+    """
+    return sum(
+        (1 if value > 0 else 0) if key == "duplicate_rows_count" else len(value)
+        for key, value in findings.items()
+        if key not in FINDING_DETAIL_KEYS
+    )
+
+# Workbooks with fewer cells (per the sheets' stored dimensions) are loaded in-process:
+# starting worker processes would take longer than reading them.
+WORKBOOK_PARALLEL_MIN_CELLS = 1_000_000
+
+def _profile_sheet(sheet_name, df, load_seconds, error):
+    """
+    Analyzes one sheet loaded by workers.load_excel_sheets(). Large sheets have their columns
+    profiled in worker processes first (see profile_columns_parallel()). Returns the sheet's
+    result for the workbook report; the frame itself is discarded.
+    """
+    result = {'sheet': sheet_name, 'rows': None, 'columns': None, 'load_seconds': load_seconds,
+              'analysis_seconds': None, 'findings': None, 'numeric_columns_found': False, 'error': error}
+    if df is None:
+        return result
+    try:
+        started = time.perf_counter()
+        stats = ColumnStatistics(df)
+        profile_columns_parallel(df, stats)
+        result['findings'] = compute_quality_findings(df, stats)
+        result['analysis_seconds'] = time.perf_counter() - started
+        result['rows'], result['columns'] = df.shape
+        result['numeric_columns_found'] = not df.select_dtypes(include=['number']).columns.empty
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+def workbook_shards(sheet_sizes, worker_count):
+    """
+    Splits the sheets into at most worker_count groups of similar total size (largest sheet
+    first, each to the lightest group). Sheets of unknown size count as one cell.
+    Returns lists of sheet names in workbook order.
+    """
+    cells = {name: (rows or 1) * (cols or 1) for name, (rows, cols) in sheet_sizes.items()}
+    shards = [[] for _ in range(min(worker_count, len(cells)))]
+    loads = [0] * len(shards)
+    for name in sorted(cells, key=cells.get, reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(name)
+        loads[lightest] += cells[name]
+    order = list(sheet_sizes)
+    return [sorted(shard, key=order.index) for shard in shards if shard]
+
+def profile_workbook(uploaded_file, sheet_sizes, engine='openpyxl-stream', max_workers=None):
+    """
+    Loads the sheets of a workbook in a process pool and analyzes each group of sheets as
+    soon as it arrives. `sheet_sizes` maps sheet names to (rows, columns) as listed by
+    list_excel_sheets(). The sheets are split into one group per worker (see workbook_shards())
+    and each worker opens the workbook once for its whole group, so the workbook structure
+    and shared strings are parsed once per worker rather than once in all. The analysis
+    runs here, one sheet at a time while later groups are still loading; only the columns
+    of large sheets are profiled in parallel (see _profile_sheet()).
+    Returns a dictionary with per-sheet results (in workbook order) and the total time.
+    """
+    started = time.perf_counter()
+    max_workers = max_workers or os.cpu_count() or 1
+    if all(rows is not None and cols is not None for rows, cols in sheet_sizes.values()) and \
+            sum(rows * cols for rows, cols in sheet_sizes.values()) < WORKBOOK_PARALLEL_MIN_CELLS:
+        max_workers = 1
+    shards = workbook_shards(sheet_sizes, max_workers)
+    results = {}
+    # Worker processes open the workbook by path, so the upload is saved to a temporary file
+    with spooled_upload(uploaded_file, suffix=os.path.splitext(uploaded_file.name)[1]) as path:
+        loaded = run_shards_in_order(workers.load_excel_sheets, [(path, shard, engine) for shard in shards], max_workers)
+        try:
+            for _, sheets in loaded:
+                for sheet_name, df, load_seconds, error in sheets:
+                    results[sheet_name] = _profile_sheet(sheet_name, df, load_seconds, error)
+        finally:
+            loaded.close()
+    return {'type': 'workbook', 'sheets': [results[name] for name in sheet_sizes],
+            'total_seconds': time.perf_counter() - started}
+
+def render_workbook_report(file_name, workbook):
+    """
+    Displays the consolidated workbook report: a summary table and per-sheet findings.
+    """
+    st.subheader(f"Workbook Report for: `{file_name}`")
+    summary = pd.DataFrame([
+        {
+            'Sheet': sheet['sheet'],
+            'Rows': sheet['rows'],
+            'Columns': sheet['columns'],
+            'Issues': None if sheet['findings'] is None else count_issues(sheet['findings']),
+            'Load (s)': sheet['load_seconds'],
+            'Analysis (s)': sheet['analysis_seconds'],
+            'Error': sheet['error'] or '',
+        }
+        for sheet in workbook['sheets']
+    ])
+    st.dataframe(summary, hide_index=True)
+    st.write(f"Profiled {len(workbook['sheets'])} sheet(s) in {workbook['total_seconds']:.2f} seconds.")
+
+    for sheet in workbook['sheets']:
+        with st.expander(f"Sheet: {sheet['sheet']}"):
+            if sheet['error']:
+                st.error(f"Error loading or analyzing this sheet: {sheet['error']}")
+                continue
+            render_quality_report(sheet['sheet'], sheet['findings'], numeric_columns_found=sheet['numeric_columns_found'])
+            suggest_cleaning_actions(sheet['findings'])
+
+# --- Batch (Multi-File) Profiling ---
+
+# Upper bound on files loaded at once in batch mode. Each worker holds one parsed file,
+# so this also bounds the memory a batch needs.
+BATCH_MAX_WORKERS = 8
+
+def load_batch_file(file_bytes, file_name):
+    """
+    Loads one uploaded file from its bytes with automatically detected options.
+    CSV/TSV files get the sniffed encoding and dialect; Excel files load their first sheet.
+    Runs in a worker thread, so it must not call Streamlit. Raises on error.
+    """
+    buffer = io.BytesIO(file_bytes) # Shares the bytes, no copy
+    buffer.name = file_name # The readers pick the format from the extension
+    base_name, compression = split_compression(file_name)
+    if compression and not base_name.endswith(('.csv', '.tsv')):
+        raise ValueError("Only CSV/TSV files can be uploaded compressed (e.g. `data.csv.gz`).")
+    if base_name.endswith(('.csv', '.tsv')):
+        sample = read_sample(buffer, compression=compression)
+        encoding = detect_encoding(sample)
+        dialect = sniff_dialect(sample, encoding, default_delimiter='\t' if base_name.endswith('.tsv') else ',')
+        buffer.seek(0)
+        return read_csv_tsv(buffer, encoding=encoding, delimiter=dialect['delimiter'],
+                            quotechar=dialect['quotechar'], compression=compression,
+                            header='infer' if dialect['has_header'] else None)
+    if file_name.endswith(('.xlsx', '.xls')):
+        first_sheet = list_excel_sheets(buffer)[0][0]
+        buffer.seek(0)
+        return read_excel_sheet(buffer, first_sheet)
+    if file_name.endswith(COLUMNAR_EXTENSIONS):
+        return read_columnar(buffer)
+    raise ValueError("PDF files cannot be profiled in a batch. Upload them on their own.")
+
+def _profile_file(file_bytes, file_name):
+    """
+    Loads and analyzes one file of a batch. Runs in a worker thread, so it must not call Streamlit.
+    Only the findings and a preview are kept, not the DataFrame.
+    """
+    result = {'file': file_name, 'rows': None, 'columns': None, 'load_seconds': None,
+              'analysis_seconds': None, 'findings': None, 'numeric_columns_found': False,
+              'preview': None, 'error': None}
+    try:
+        started = time.perf_counter()
+        df = load_batch_file(file_bytes, file_name)
+        loaded = time.perf_counter()
+        result['findings'] = compute_quality_findings(df, ColumnStatistics(df)) # Thread-local; the frame is discarded
+        result['analysis_seconds'] = time.perf_counter() - loaded
+        result['load_seconds'] = loaded - started
+        result['rows'], result['columns'] = df.shape
+        result['numeric_columns_found'] = not df.select_dtypes(include=['number']).columns.empty
+        result['preview'] = df.head()
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+def profile_batch(uploaded_files, max_workers=None):
+    """
+    Loads and analyzes several uploaded files concurrently in a bounded thread pool.
+    A file is only handed to the pool when a worker is free, so at most max_workers
+    uploads are being read at a time. Files parsed on an earlier rerun are taken from
+    the parse cache, so adding a file to the batch only profiles the new one.
+    Returns per-file results in upload order.
+    """
+    started = time.perf_counter()
+    cache = get_parse_cache()
+    keys = [(file_fingerprint(uploaded_file), 'batch_file', uploaded_file.name) for uploaded_file in uploaded_files]
+    results = [cache.get(key) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if pending:
+        max_workers = max_workers or min(len(pending), os.cpu_count() or 1, BATCH_MAX_WORKERS)
+        progress_bar = st.progress(0.0, text=f"Profiling {len(pending)} file(s)...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            queued = iter(pending)
+            futures = {}
+
+            def submit_next():
+                i = next(queued, None)
+                if i is not None:
+                    futures[executor.submit(_profile_file, uploaded_files[i].getvalue(), uploaded_files[i].name)] = i
+
+            for _ in range(max_workers):
+                submit_next()
+            done = 0
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = futures.pop(future)
+                    results[i] = future.result()
+                    if results[i]['error'] is None:
+                        cache.put(keys[i], results[i]) # Failed files are retried on the next rerun
+                    done += 1
+                    progress_bar.progress(done / len(pending), text=f"Profiled {done} of {len(pending)} file(s)")
+                    submit_next()
+        progress_bar.empty()
+    return {'type': 'batch', 'files': results, 'total_seconds': time.perf_counter() - started}
+
+def render_batch_report(batch):
+    """
+    Displays the batch report: a summary table with one row per file and per-file drill-down.
+    """
+    st.subheader(f"Batch Report for {len(batch['files'])} file(s)")
+    summary = pd.DataFrame([
+        {
+            'File': result['file'],
+            'Rows': result['rows'],
+            'Columns': result['columns'],
+            'Issues': None if result['findings'] is None else count_issues(result['findings']),
+            'Missing Cells': None if result['findings'] is None else sum(result['findings']['missing_values'].values()),
+            'Duplicate Rows': None if result['findings'] is None else int(result['findings']['duplicate_rows_count']),
+            'Load (s)': result['load_seconds'],
+            'Analysis (s)': result['analysis_seconds'],
+            'Error': result['error'] or '',
+        }
+        for result in batch['files']
+    ])
+    st.dataframe(summary, hide_index=True)
+    st.write(f"Profiled {len(batch['files'])} file(s) in {batch['total_seconds']:.2f} seconds.")
+
+    for result in batch['files']:
+        with st.expander(f"File: {result['file']}"):
+            if result['error']:
+                st.error(f"Error loading or analyzing this file: {result['error']}")
+                continue
+            st.dataframe(result['preview'])
+            render_quality_report(result['file'], result['findings'], numeric_columns_found=result['numeric_columns_found'])
+            suggest_cleaning_actions(result['findings'])
 
 # --- Cleaning Suggestion Function (UPDATED for Excel/Google Sheets) ---
 
@@ -380,6 +2699,9 @@ def suggest_cleaning_actions(findings):
         st.markdown("### 🧹 Incorrect Data Types:")
         for col in findings["incorrect_datatypes"]:
             st.write(f"- Column `{col}` appears to be numbers (e.g., '123') but is stored as text. This can prevent calculations.")
+            coercion = findings["numeric_coercion"].get(col)
+            if coercion:
+                st.write(f"  - {coercion['ratio']:.0%} of its values are numbers; {coercion['unparsed']} non-numeric value(s) would become empty after conversion.")
             st.markdown(f"  - **Suggestion (Google Sheets/Excel Formula):** In a new column, use `=VALUE(A1)` (assuming text number is in A1) and then copy-paste values back to the original column.")
             st.markdown(f"  - **Excel Feature:** Select the column, then Data tab > Data Tools group > Text to Columns > Finish (this often forces conversion).")
             st.markdown(f"  - **Excel Feature:** Look for a small green triangle in the top-left of cells; click it and choose 'Convert to Number'.")
@@ -429,13 +2751,21 @@ def auto_clean_dataframe(df, findings):
     This applies common, relatively safe cleaning operations.
     """
     cleaned_df = df.copy() # Work on a copy to avoid modifying the original DataFrame directly
+    # The original's statistics still describe columns the steps below leave untouched, as long as no rows are removed
+    original_stats = column_statistics(df)
+    cleaned_stats = ColumnStatistics(cleaned_df) # Computed lazily, only for columns that changed
+    modified_columns = set()
 
     st.subheader("Automated Cleaning Steps Applied:")
 
     # 1. Remove Duplicate Rows (entire row duplicates)
     if findings["duplicate_rows_count"] > 0:
         initial_rows = len(cleaned_df)
-        cleaned_df.drop_duplicates(inplace=True)
+        is_duplicate = original_stats.duplicated_rows() # Same rows as drop_duplicates(), without hashing them again
+        if is_duplicate.any():
+            cleaned_df = cleaned_df[~is_duplicate]
+            cleaned_stats = ColumnStatistics(cleaned_df)
+            original_stats = cleaned_stats
         st.write(f"- Removed {initial_rows - len(cleaned_df)} duplicate row(s).")
     else:
         st.write("- No duplicate rows to remove.")
@@ -444,8 +2774,10 @@ def auto_clean_dataframe(df, findings):
     if findings["whitespace_issues"]:
         st.write("- Trimming leading/trailing whitespace from affected text columns:")
         for col in findings["whitespace_issues"]:
-            if pd.api.types.is_object_dtype(cleaned_df[col]): # Ensure it's a string/object column
+            if workers.is_text_column(cleaned_df[col]): # Ensure it's a string/object column
                 cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
+                modified_columns.add(col)
+                cleaned_stats.invalidate(col)
                 st.write(f"  - Trimmed whitespace in column `{col}`.")
     else:
         st.write("- No leading/trailing whitespace issues to fix.")
@@ -454,8 +2786,10 @@ def auto_clean_dataframe(df, findings):
     if findings["inconsistent_categorical"]:
         st.write("- Standardizing casing to lowercase for affected categorical columns:")
         for col in findings["inconsistent_categorical"]:
-            if pd.api.types.is_object_dtype(cleaned_df[col]): # Ensure it's a string/object column
+            if workers.is_text_column(cleaned_df[col]): # Ensure it's a string/object column
                 cleaned_df[col] = cleaned_df[col].astype(str).str.lower()
+                modified_columns.add(col)
+                cleaned_stats.invalidate(col)
                 st.write(f"  - Converted column `{col}` to lowercase.")
     else:
         st.write("- No casing inconsistencies to fix (auto-converted to lowercase).")
@@ -464,7 +2798,10 @@ def auto_clean_dataframe(df, findings):
     if findings["incorrect_datatypes"]:
         st.write("- Converting detected numerical columns to numeric type:")
         for col in findings["incorrect_datatypes"]:
-            cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce')
+            stats = cleaned_stats if col in modified_columns else original_stats
+            cleaned_df[col] = stats.numeric_values(col) # Reuses the conversion done by the check
+            modified_columns.add(col)
+            cleaned_stats.invalidate(col)
             st.write(f"  - Converted column `{col}` to numeric. Non-convertible values are now empty (NaN).")
     else:
         st.write("- No incorrect data types to fix.")
@@ -473,15 +2810,20 @@ def auto_clean_dataframe(df, findings):
     if findings["missing_values"]:
         st.write("- Handling missing values (simple imputation):")
         for col in findings["missing_values"]:
+            stats = cleaned_stats if col in modified_columns else original_stats
             if pd.api.types.is_numeric_dtype(cleaned_df[col]):
                 # Fill numerical missing with mean
-                mean_val = cleaned_df[col].mean()
-                cleaned_df[col].fillna(mean_val, inplace=True)
+                mean_val = stats.distribution(col)['mean']
+                if pd.api.types.is_integer_dtype(cleaned_df[col]):
+                    cleaned_df[col] = cleaned_df[col].astype('float64') # Nullable integers (e.g. 'Int8') cannot hold the mean
+                # Assign back: under copy-on-write an inplace fillna on a column selection does not change cleaned_df
+                cleaned_df[col] = cleaned_df[col].fillna(mean_val)
                 st.write(f"  - Filled missing numerical values in `{col}` with its mean ({mean_val:.2f}).")
-            elif pd.api.types.is_object_dtype(cleaned_df[col]):
+            elif workers.is_text_column(cleaned_df[col]):
                 # Fill categorical missing with mode (most frequent)
-                mode_val = cleaned_df[col].mode()[0] if not cleaned_df[col].mode().empty else "Unknown"
-                cleaned_df[col].fillna(mode_val, inplace=True)
+                modes = stats.mode(col)
+                mode_val = modes[0] if modes else "Unknown"
+                cleaned_df[col] = cleaned_df[col].fillna(mode_val)
                 st.write(f"  - Filled missing categorical values in `{col}` with its mode ('{mode_val}').")
             else:
                 st.write(f"  - Missing values in `{col}` (non-numeric/non-categorical) were not auto-filled.")
@@ -492,11 +2834,15 @@ def auto_clean_dataframe(df, findings):
     # This is a more aggressive auto-clean, so use with caution.
     if findings["uniqueness_violations"]:
         st.write("- Attempting to remove duplicates based on potential ID columns:")
+        kept_rows = np.arange(len(cleaned_df)) # Positions still kept; rows are dropped once, after all columns
         for col in findings["uniqueness_violations"]:
-            initial_rows = len(cleaned_df)
+            stats = cleaned_stats if col in modified_columns else original_stats
             # Drop duplicates based on the specific column identified as having uniqueness violations
-            cleaned_df.drop_duplicates(subset=[col], inplace=True)
-            st.write(f"  - Removed {initial_rows - len(cleaned_df)} duplicate entries in column `{col}` to ensure uniqueness.")
+            is_duplicate = stats.duplicated_values(col, kept_rows)
+            kept_rows = kept_rows[~is_duplicate]
+            st.write(f"  - Removed {int(is_duplicate.sum())} duplicate entries in column `{col}` to ensure uniqueness.")
+        if len(kept_rows) < len(cleaned_df):
+            cleaned_df = cleaned_df.iloc[kept_rows]
 
     st.success("✨ Automated cleaning process completed!")
     return cleaned_df
@@ -517,32 +2863,35 @@ def display_column_summary(df):
 
     st.markdown("---")
 
+    stats = column_statistics(df) # Shared with the quality checks, which reuse these results
     for col in df.columns:
         st.subheader(f"Column: `{col}`")
         st.write(f"**Data Type:** `{df[col].dtype}`")
-        st.write(f"**Non-Null Count:** `{df[col].count()}`")
-        st.write(f"**Missing Values:** `{df[col].isnull().sum()}`")
+        st.write(f"**Non-Null Count:** `{stats.non_null(col)}`")
+        st.write(f"**Missing Values:** `{stats.missing(col)}`")
 
         if pd.api.types.is_numeric_dtype(df[col]):
+            distribution = stats.distribution(col)
             st.markdown("**Numerical Statistics:**")
-            st.write(f"- **Mean:** `{df[col].mean():.2f}`")
-            st.write(f"- **Median:** `{df[col].median():.2f}`")
-            st.write(f"- **Min:** `{df[col].min():.2f}`")
-            st.write(f"- **Max:** `{df[col].max():.2f}`")
-            st.write(f"- **Standard Deviation:** `{df[col].std():.2f}`")
-            st.write(f"- **Mode:** `{df[col].mode().tolist()}`") # Mode can be multiple
-        elif pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+            st.write(f"- **Mean:** `{distribution['mean']:.2f}`")
+            st.write(f"- **Median:** `{distribution['median']:.2f}`")
+            st.write(f"- **Min:** `{distribution['min']:.2f}`")
+            st.write(f"- **Max:** `{distribution['max']:.2f}`")
+            st.write(f"- **Standard Deviation:** `{distribution['std']:.2f}`")
+            st.write(f"- **Mode:** `{stats.mode(col)}`") # Mode can be multiple
+        elif workers.is_text_column(df[col]):
             st.markdown("**Categorical/Text Statistics:**")
-            unique_count = df[col].nunique()
+            unique_count = stats.nunique(col)
             st.write(f"- **Unique Values Count:** `{unique_count}`")
             st.write(f"- **Percentage Unique:** `{unique_count / len(df) * 100:.2f}%`")
             st.write(f"- **Top 5 Most Frequent Values:**")
-            st.dataframe(df[col].value_counts().head(5).to_frame(name='Count'))
+            st.dataframe(stats.value_counts(col).head(5).to_frame(name='Count'))
         elif pd.api.types.is_datetime64_any_dtype(df[col]):
+            distribution = stats.distribution(col)
             st.markdown("**Date/Time Statistics:**")
-            st.write(f"- **Min Date:** `{df[col].min()}`")
-            st.write(f"- **Max Date:** `{df[col].max()}`")
-            st.write(f"- **Unique Dates Count:** `{df[col].nunique()}`")
+            st.write(f"- **Min Date:** `{distribution['min']}`")
+            st.write(f"- **Max Date:** `{distribution['max']}`")
+            st.write(f"- **Unique Dates Count:** `{stats.nunique(col)}`")
         else:
             st.info("No specific statistics available for this data type.")
         st.markdown("---")
@@ -662,6 +3011,37 @@ def main():
                 st.info("Click 'Auto Clean Data' to apply basic automated cleaning steps.")
 
 
+        elif isinstance(content, dict) and content.get('type') == 'stream': # Streaming-mode CSV/TSV analysis
+            if content['preview'] is not None:
+                st.dataframe(content['preview']) # First rows of the first chunk, read as text
+            st.write(f"Shape: {content['rows']} rows, {content['columns']} columns")
+            st.info("💡 **Streaming mode:** The file was analyzed chunk by chunk without loading it fully. Column summary and auto-cleaning need the full data, so turn streaming mode off to use them. Outlier bounds on very large columns are estimated from a random sample. Memory grows only with the number of distinct rows, IDs and text values (8 bytes each), plus the values written more than one way, not with the file size.")
+
+            render_quality_report(file_name, content['findings'], numeric_columns_found=content['numeric_columns_found'])
+            suggest_cleaning_actions(content['findings'])
+
+        elif isinstance(content, dict) and content.get('type') == 'estimate': # Fast-estimate CSV/TSV analysis
+            if content['preview'] is not None:
+                st.dataframe(content['preview']) # First rows of the file, read as text
+            st.write(f"Shape: {content['rows']} rows, {content['columns']} columns")
+            if content['sample_rows'] < content['rows']:
+                st.info(f"💡 **Fast estimate:** The checks ran on a random sample of {content['sample_rows']:,} of {content['rows']:,} rows. Counts below are scaled up to the whole file (duplicate rows are estimated from a sketch of every row's hash); column-level issues affecting very few rows may not show up in the sample.")
+                st.dataframe(pd.DataFrame(content['intervals']), hide_index=True)
+            else:
+                st.info("💡 **Fast estimate:** The file is smaller than the sample, so these results are exact.")
+            st.button("🎯 Run exact analysis", on_click=promote_to_exact, args=(file_name,))
+
+            render_quality_report(file_name, content['findings'], numeric_columns_found=content['numeric_columns_found'])
+            suggest_cleaning_actions(content['findings'])
+
+        elif isinstance(content, dict) and content.get('type') == 'workbook': # All sheets of an Excel workbook
+            st.info("💡 **Workbook mode:** Every sheet was loaded and analyzed. Turn workbook mode off and pick a sheet to see its column summary and to auto-clean it.")
+            render_workbook_report(file_name, content)
+
+        elif isinstance(content, dict) and content.get('type') == 'batch': # Several files uploaded at once
+            st.info("💡 **Batch mode:** Every file was loaded with automatically detected options and analyzed. CSV/TSV delimiters and encodings are sniffed and Excel files are read from their first sheet. Upload a single file to adjust its options, see its column summary or auto-clean it.")
+            render_batch_report(content)
+
         elif isinstance(content, str): # Handle PDF text content
             st.text_area(f"Text Content from '{file_name}' (first 500 chars):", content[:500], height=200)
             st.info("💡 **Note on PDF:** This is raw text. For structured tables, manual copy/paste or specialized tools (like `pdfplumber`, `camelot-py`) are typically required for accurate extraction.")
@@ -0,0 +1,100 @@
+"""
+Startup-time benchmark: measures how long a fresh interpreter takes to import app.py.
+
+Each run imports the app in a new process (as a cold container start would) with
+`-X importtime`, then reports the median import time, the slowest imported modules,
+and any heavy optional backend that was imported at startup although it should be
+deferred until first use. A summary line is appended to bench_output.txt.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--top 15] [--output bench_output.txt]
+
+Exits with status 1 if a deferred backend was imported at startup.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Backends that app.py must only import on first use.
+DEFERRED_MODULES = ['camelot', 'cv2', 'PyPDF2', 'pyarrow.csv', 'openpyxl', 'python_calamine']
+
+IMPORT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import app
+elapsed = time.perf_counter() - started
+print(json.dumps({'seconds': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def run_once():
+    """
+    Imports app in a fresh interpreter. Returns (import seconds, deferred modules loaded,
+    {module: cumulative microseconds}) parsed from -X importtime.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_SNIPPET],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module = line[len('import time:'):].split('|')
+        module = module.rstrip()
+        depth = len(module) - len(module.lstrip()) # 1 for top-level, +2 per nesting level
+        if depth > 3: # Keep app itself and the modules it imports directly
+            continue
+        cumulative[module.strip()] = int(cumulative_us)
+    return result['seconds'], result['loaded'], cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="number of cold imports to time")
+    parser.add_argument('--top', type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'bench_output.txt'),
+                        help="file the summary line is appended to")
+    args = parser.parse_args()
+
+    timings = []
+    loaded = set()
+    cumulative = {}
+    for _ in range(args.runs):
+        seconds, run_loaded, run_cumulative = run_once()
+        timings.append(seconds)
+        loaded.update(run_loaded)
+        cumulative = run_cumulative # Report the last run; earlier runs warm the OS file cache
+
+    median = statistics.median(timings)
+    print(f"import app: median {median:.3f}s over {args.runs} run(s) "
+          f"(min {min(timings):.3f}s, max {max(timings):.3f}s)")
+    print("\nSlowest imports made by app.py (cumulative):")
+    for module, us in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1e6:8.3f}s  {module}")
+    if loaded:
+        print(f"\nDeferred backends imported at startup: {', '.join(sorted(loaded))}")
+
+    with open(args.output, 'a') as output:
+        output.write(json.dumps({
+            'benchmark': 'startup_import',
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'runs': args.runs,
+            'median_seconds': round(median, 4),
+            'min_seconds': round(min(timings), 4),
+            'deferred_loaded': sorted(loaded),
+        }) + '\n')
+    return 1 if loaded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
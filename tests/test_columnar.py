@@ -0,0 +1,27 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import app
+
+
+class Upload(io.BytesIO):
+    name = 'nested.parquet'
+
+
+def test_nested_columns_are_checked_as_text():
+    table = pa.table({
+        'tags': [['a', 'b'], None, ['a', 'b']],
+        'address': [{'city': 'Ipoh'}, {'city': 'Johor'}, {'city': 'Ipoh'}],
+        'count': [1, 2, 1],
+    })
+    data = io.BytesIO()
+    pq.write_table(table, data)
+
+    df = app.read_columnar(Upload(data.getvalue()))
+    assert df['tags'].tolist()[::2] == ['["a", "b"]', '["a", "b"]']
+    assert df['address'].tolist()[0] == '{"city": "Ipoh"}'
+    findings = app.analyze_dataframe_quality('nested', df)
+    assert findings['missing_values'] == {'tags': 1}
+    assert findings['duplicate_rows_count'] == 1 # Rows 0 and 2 hold the same lists and structs
@@ -0,0 +1,44 @@
+import io
+
+import pandas as pd
+import pytest
+
+import app
+
+
+def findings_both_ways(values):
+    # The exact path on a loaded frame, and the streaming path on the same data as CSV
+    df = pd.DataFrame({'date': values})
+    exact = app.analyze_dataframe_quality('fixture', df)
+    data = io.BytesIO(df.to_csv(index=False).encode())
+    streamed = app.analyze_csv_streaming(data, chunksize=3)['findings']
+    return exact, streamed
+
+
+@pytest.mark.parametrize('values, formats', [
+    (['2020-01-03', '2020/01/04'] * 4, {'%Y-%m-%d': 4, '%Y/%m/%d': 4}),
+    (['2020-01-03', '2020-01-04 10:00:00'] * 4, {'%Y-%m-%d': 4, '%Y-%m-%d %H:%M:%S': 4}),
+    (['2020-01-03T10:00:00Z', '2020-01-04T10:00:00+02:00', '2020-01-05 10:00:00'] * 4,
+     {'ISO8601': 8, '%Y-%m-%d %H:%M:%S': 4}),
+], ids=['dash-and-slash', 'date-and-datetime', 'mixed-timezones'])
+def test_mixed_formats_are_reported(values, formats):
+    exact, streamed = findings_both_ways(values)
+    assert exact['date_formats']['date'] == {'formats': formats, 'unparsed': 0}
+    assert 'date' in exact['date_format_inconsistencies']
+    assert streamed['date_formats'] == exact['date_formats']
+    assert streamed['date_format_inconsistencies'] == exact['date_format_inconsistencies']
+
+
+def test_compact_dates_are_not_valid_in_a_dashed_column():
+    exact, streamed = findings_both_ways(['2020-01-03', '20200104'] * 4)
+    assert exact['date_formats']['date'] == {'formats': {'%Y-%m-%d': 4}, 'unparsed': 4}
+    assert streamed['date_formats'] == exact['date_formats']
+
+
+@pytest.mark.parametrize('values', [
+    ['2020-01-03', '2020-02-13'] * 4,
+    ['2020-01-03T10:00:00.123Z', '2020-01-03T10:00:00.5Z'] * 4,
+], ids=['dates', 'iso-timestamps'])
+def test_consistent_formats_are_not_reported(values):
+    exact, streamed = findings_both_ways(values)
+    assert exact['date_format_inconsistencies'] == streamed['date_format_inconsistencies'] == {}
@@ -0,0 +1,52 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app
+
+
+def make_frame(rows=200_000, seed=1):
+    # Few distinct values, so the file has many identical rows
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'group': rng.choice(['a', 'b'], rows),
+        'score': np.where(rng.random(rows) < 0.1, np.nan, rng.choice([1.0, 2.0], rows)),
+    })
+
+
+def test_sample_is_a_row_sample_not_a_cluster_sample():
+    df = make_frame()
+    data = io.BytesIO(df.to_csv(index=False).encode())
+    sample, rows, _, distinct_rows = app.sample_csv_rows(data, sample_rows=10_000)
+    assert rows == len(df)
+    assert len(sample) == 10_000
+    # Identical rows are drawn independently: every combination of values shows up
+    assert len(sample.drop_duplicates()) == len(df.drop_duplicates())
+    assert distinct_rows == (6, 6, 6) # Fewer distinct rows than the sketch holds: exact
+
+
+@pytest.mark.parametrize('df', [
+    make_frame(),
+    # More distinct rows than the sketch holds, so duplicates are estimated
+    pd.concat([make_frame(rows=150_000).assign(id=np.arange(150_000))] * 2, ignore_index=True),
+], ids=['few-distinct-rows', 'many-distinct-rows'])
+def test_estimates_cover_the_exact_counts(df):
+    exact = app.analyze_dataframe_quality('fixture', df)
+    data = io.BytesIO(df.to_csv(index=False).encode())
+    result = app.analyze_csv_estimate(data, sample_rows=10_000)
+    intervals = {(row['Check'], row['Column']): row for row in result['intervals']}
+
+    missing = intervals[('Missing values', 'score')]
+    assert missing['95% CI Low'] <= exact['missing_values']['score'] <= missing['95% CI High']
+    duplicates = intervals[('Duplicate rows', '')]
+    assert duplicates['95% CI Low'] <= exact['duplicate_rows_count'] <= duplicates['95% CI High']
+    assert result['findings']['missing_values'].keys() == exact['missing_values'].keys()
+
+
+def test_sample_is_reproducible():
+    data = make_frame(rows=50_000).to_csv(index=False).encode()
+    first, _, _, _ = app.sample_csv_rows(io.BytesIO(data), sample_rows=1_000)
+    second, _, _, _ = app.sample_csv_rows(io.BytesIO(data), sample_rows=1_000, chunksize=7_000)
+    pd.testing.assert_frame_equal(first, second)
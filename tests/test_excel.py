@@ -0,0 +1,31 @@
+import io
+
+import openpyxl
+import pandas as pd
+
+import workers
+
+
+def test_streamed_sheet_matches_read_excel():
+    columns = {
+        'ints': ['12', '7', '3'],
+        'floats_with_na': ['12', 'n/a', '3.5'],
+        'mixed_numbers': [1, '2.5', 3],
+        'booleans': ['True', 'false', 'TRUE'],
+        'booleans_with_na': ['True', None, 'False'],
+        'mixed_booleans': [True, 'False', True],
+        'thousands': ['1,000', '2', '3'],
+        'empty': [None, None, None],
+        'text': ['a', '12', None],
+    }
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(list(columns))
+    for i in range(3):
+        sheet.append([values[i] for values in columns.values()])
+    data = io.BytesIO()
+    workbook.save(data)
+
+    expected = pd.read_excel(io.BytesIO(data.getvalue()))
+    streamed = workers.read_worksheet(openpyxl.load_workbook(io.BytesIO(data.getvalue()), read_only=True).active)
+    pd.testing.assert_frame_equal(streamed, expected)
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import app
+
+
+def make_frame(rows=5_000, seed=4):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'name': rng.choice(['Ali', 'ali ', 'Siti', None], rows),
+        'amount': rng.choice(['1', '2.5', 'x'], rows),
+        'joined': rng.choice(['2020-01-03', '2020/01/04', 'soon'], rows),
+        'score': np.where(rng.random(rows) < 0.01, 1_000.0, rng.normal(0, 1, rows)),
+        'user_id': rng.integers(0, rows, rows),
+        'level': pd.Categorical(rng.choice(['a', 'A', 'b'], rows)),
+    })
+    return pd.concat([df, df.head(10)], ignore_index=True)
+
+
+def test_parallel_profile_matches_the_serial_analysis(monkeypatch):
+    df = make_frame()
+    expected = app.analyze_dataframe_quality('fixture', df.copy())
+
+    monkeypatch.setattr(app, 'PARALLEL_PROFILE_MIN_CELLS', 0)
+    stats = app.ColumnStatistics(df)
+    app.profile_columns_parallel(df, stats, max_workers=2)
+    # Every check's statistics come from the workers, not from the main process
+    for col in ['name', 'amount', 'joined', 'level']:
+        assert {'text_consistency', 'numeric_coercion', 'date_formats'} <= stats._columns[col].keys()
+    assert 'outliers' in stats._columns['score']
+
+    findings = app.compute_quality_findings(df, stats)
+    for key in expected:
+        assert findings[key] == expected[key], key
+    if os.path.isdir('/dev/shm'):
+        assert not [name for name in os.listdir('/dev/shm') if name.startswith('psm_')]
@@ -0,0 +1,34 @@
+import pandas as pd
+
+import app
+
+
+def stitched_rows(tables):
+    return [(table['pages'], table['df'].values.tolist()) for table in app.stitch_pdf_tables(tables)]
+
+
+def test_one_row_continuation_is_kept():
+    tables = [
+        (1, pd.DataFrame([['Name', 'Age'], ['a', '1'], ['b', '2']])),
+        (2, pd.DataFrame([['c', '3']])),
+    ]
+    assert stitched_rows(tables) == [((1, 2), [['Name', 'Age'], ['a', '1'], ['b', '2'], ['c', '3']])]
+
+
+def test_repeated_header_is_dropped():
+    tables = [
+        (1, pd.DataFrame([['Name', 'Age'], ['a', '1']])),
+        (2, pd.DataFrame([['name ', 'AGE'], ['b', '2']])),
+    ]
+    assert stitched_rows(tables) == [((1, 2), [['Name', 'Age'], ['a', '1'], ['b', '2']])]
+
+
+def test_text_tables_with_their_own_header_are_not_merged():
+    tables = [
+        (1, pd.DataFrame([['City', 'Country'], ['Ipoh', 'Malaysia']])),
+        (2, pd.DataFrame([['Dept', 'Head'], ['Sales', 'Aina']])),
+    ]
+    assert stitched_rows(tables) == [
+        ((1, 1), [['City', 'Country'], ['Ipoh', 'Malaysia']]),
+        ((2, 2), [['Dept', 'Head'], ['Sales', 'Aina']]),
+    ]
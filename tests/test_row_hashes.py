@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+import app
+
+
+def make_frame():
+    return pd.DataFrame({
+        'amount': [0.0, -0.0, np.nan, 1.5, 0.0, np.nan, 1.5, 0.0],
+        'code': [1, 1, None, 'a', 1, np.nan, 'a', '1'],
+        'name': ['x', 'x', None, 'y', 'x', None, 'y', 'x'],
+    }, index=[10, 11, 12, 13, 14, 15, 16, 17])
+
+
+def test_duplicated_rows_match_pandas():
+    df = make_frame()
+    stats = app.ColumnStatistics(df)
+    np.testing.assert_array_equal(stats.duplicated_rows(), df.duplicated().to_numpy())
+    assert stats.duplicate_rows() == int(df.duplicated().sum())
+
+
+def test_duplicate_row_groups_match_pandas():
+    df = make_frame()
+    duplicated = df[df.duplicated(keep=False)]
+    expected = [group.tolist() for _, group in duplicated.groupby(list(df.columns), sort=False, dropna=False).groups.items()]
+    findings = app.analyze_dataframe_quality('fixture', df)
+    assert findings['duplicate_rows_count'] == int(df.duplicated().sum())
+    assert sorted(findings['duplicate_row_groups']) == sorted(expected)
@@ -0,0 +1,49 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app
+
+
+def make_frame(rows=2_000, seed=2):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'gender': rng.choice(['Male', 'male', ' Female', 'Female', None], rows),
+        'amount': rng.choice(['1', '2.5', '3', 'n/a'], rows),
+        'score': np.where(rng.random(rows) < 0.02, rng.normal(100, 1, rows), rng.normal(0, 1, rows)).round(3),
+        'count': rng.integers(0, 50, rows),
+        'staff_id': rng.integers(0, rows * 2, rows),
+        'joined': rng.choice(['2020-01-03', '03/01/2020', 'unknown', None], rows),
+        'active': rng.choice(['True', 'true', 'False'], rows),
+        'flag': rng.choice(['TRUE', 'false', None], rows),
+    })
+    return pd.concat([df, df.head(25)], ignore_index=True) # Duplicate rows
+
+
+@pytest.mark.parametrize('chunksize', [97, 500, 10_000])
+def test_streaming_matches_the_exact_analysis(chunksize):
+    raw = make_frame().to_csv(index=False).encode()
+    exact = app.analyze_dataframe_quality('fixture', pd.read_csv(io.BytesIO(raw)))
+    streamed = app.analyze_csv_streaming(io.BytesIO(raw), chunksize=chunksize)['findings']
+    for key in exact:
+        assert streamed[key] == exact[key], key
+
+
+def test_boolean_columns_are_not_text():
+    raw = pd.DataFrame({'active': ['True', 'true', 'FALSE'] * 10}).to_csv(index=False).encode()
+    findings = app.analyze_csv_streaming(io.BytesIO(raw), chunksize=7)['findings']
+    assert findings['inconsistent_categorical'] == {}
+    assert findings['duplicate_rows_count'] == 28 # 'True' and 'true' are the same value
+    assert findings['duplicate_row_groups'][0][:3] == [0, 1, 3]
+
+
+def test_hash_set_marks_repeats_across_adds():
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 5_000, 40_000).astype('uint64')
+    hashes = app.HashSet64()
+    repeated = np.concatenate([hashes.add(part) for part in np.array_split(values, 37)])
+    np.testing.assert_array_equal(repeated, pd.Series(values).duplicated().to_numpy())
+    assert len(hashes) == len(np.unique(values))
+    np.testing.assert_array_equal(hashes.contains(np.array([values[0], 10_000], dtype='uint64')), [True, False])
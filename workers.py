@@ -0,0 +1,397 @@
+"""
+Worker functions for the app's process pools, and the helpers they share with app.py.
+
+Streamlit runs app.py as __main__, which child processes cannot import, so every
+function submitted to a ProcessPoolExecutor lives in this module instead.
+Nothing here may call Streamlit.
+"""
+
+
+def extract_pdf_tables(pdf_path, pages, read_kwargs):
+    """
+    Extracts the tables on the given pages (a Camelot page spec such as '1-4')
+    of a PDF file. Returns a list of (page number, DataFrame) in page order.
+    """
+    import camelot # Imported in the worker; it pulls in OpenCV and PDF rendering libraries
+
+    tables = camelot.read_pdf(pdf_path, pages=pages, **read_kwargs)
+    return [(int(table.page), table.df) for table in tables]
+
+
+def extract_pdf_text(pdf_path, first_page, last_page):
+    """
+    Extracts the text of pages first_page..last_page (1-based, inclusive) of a PDF file.
+    Returns a list of strings, one per page.
+    """
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(pdf_path)
+    return [reader.pages[i].extract_text() or '' for i in range(first_page - 1, last_page)]
+
+
+# Strings pandas treats as missing by default; applied by read_worksheet() so it
+# reports the same missing values as pd.read_excel.
+DEFAULT_NA_STRINGS = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+def excel_column_names(header):
+    """
+    Names columns the way pd.read_excel does: blank headers become 'Unnamed: i'
+    and repeated names get a '.1', '.2', ... suffix.
+    """
+    names = []
+    seen = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or value == '' else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def read_worksheet(worksheet, usecols=None):
+    """
+    Reads an openpyxl read-only worksheet row by row into per-column buffers and returns a
+    DataFrame. The first row is used as the header, as in pd.read_excel.
+    `usecols` keeps only those columns (by name); the other cells are skipped as they stream past.
+    Cells holding one of DEFAULT_NA_STRINGS are buffered as missing, and text columns are
+    then converted as pd.read_excel would (see infer_text_column()), so columns get the dtype
+    pd.read_excel infers (e.g. float64 for numbers with 'n/a' among them, or numbers stored as text).
+    """
+    import pandas as pd
+
+    na_strings = frozenset(DEFAULT_NA_STRINGS)
+    rows = worksheet.iter_rows(values_only=True)
+    header = list(next(rows, ()))
+    keep = names = None
+    if usecols is not None:
+        wanted = set(usecols)
+        all_names = excel_column_names(header)
+        keep = [i for i, name in enumerate(all_names) if name in wanted]
+        header = names = [all_names[i] for i in keep]
+    buffers = [[] for _ in header]
+    row_count = 0
+    last_non_empty = 0 # Trailing empty rows (e.g. formatted but blank) are dropped
+    for row in rows:
+        non_empty = any(value is not None for value in row) # Judged on the whole row, as in pd.read_excel
+        if keep is not None:
+            row = tuple(row[i] if i < len(row) else None for i in keep)
+        if len(row) > len(buffers): # A row wider than the header adds unnamed columns
+            for _ in range(len(row) - len(buffers)):
+                header.append(None)
+                buffers.append([None] * row_count)
+        for buffer, value in zip(buffers, row):
+            buffer.append(None if isinstance(value, str) and value in na_strings else value)
+        for buffer in buffers[len(row):]:
+            buffer.append(None)
+        row_count += 1
+        if non_empty:
+            last_non_empty = row_count
+
+    df = pd.DataFrame({i: buffer[:last_non_empty] for i, buffer in enumerate(buffers)})
+    df.columns = names if names is not None else excel_column_names(header)
+    for position, col in enumerate(df.columns):
+        series = df.iloc[:, position]
+        if is_text_column(series):
+            df.isetitem(position, infer_text_column(series))
+    return df
+
+
+def infer_text_column(series):
+    """
+    Converts a column of raw cell values the way pd.read_excel's parser does: columns with
+    no values at all become float64, columns whose values all read as numbers (including
+    numbers stored as text) become numerical, and columns of only 'True'/'False' text (any
+    casing) become booleans, kept in an object column if values are missing.
+    Other columns are returned unchanged.
+    """
+    import numpy as np
+
+    values = series.dropna()
+    if values.empty:
+        return series.astype('float64')
+    if series.dtype == object and any(isinstance(value, (bool, np.bool_)) for value in values):
+        return series # Mixed booleans and text are left as they are, as in pd.read_excel
+    # The first value rules out most text columns before a pass over all of them
+    first = str(values.iloc[0])
+    if to_numeric_coerce(values.iloc[:1]).notna().all():
+        numbers = to_numeric_coerce(series)
+        return numbers if numbers.notna().sum() == len(values) else series
+    if first.lower() not in ('true', 'false'):
+        return series
+    lowered = values.astype(str).str.lower()
+    if lowered.isin(('true', 'false')).all():
+        booleans = series.map({value: text == 'true' for value, text in zip(values, lowered)})
+        return booleans.astype(bool) if len(values) == len(series) else booleans.astype(object)
+    return series
+
+
+def load_excel_sheets(workbook_path, sheet_names, engine):
+    """
+    Loads several sheets of one workbook, opening it once: the workbook structure and shared
+    strings are parsed a single time for all of them. `engine` is one of the engine names in
+    app.EXCEL_ENGINE_OPTIONS ('openpyxl-stream' reads through read_worksheet()).
+    Returns a list of (sheet name, DataFrame or None, load seconds, error message or None).
+    """
+    import time
+    import pandas as pd
+
+    if engine == 'openpyxl-stream' and workbook_path.endswith('.xlsx'):
+        import openpyxl
+        workbook = openpyxl.load_workbook(workbook_path, read_only=True, data_only=True)
+        read_sheet = lambda sheet_name: read_worksheet(workbook[sheet_name])
+    else:
+        workbook = pd.ExcelFile(workbook_path, engine='calamine' if engine == 'calamine' else None)
+        read_sheet = workbook.parse
+    loaded = []
+    try:
+        for sheet_name in sheet_names:
+            started = time.perf_counter()
+            try:
+                loaded.append((sheet_name, read_sheet(sheet_name), time.perf_counter() - started, None))
+            except Exception as e: # Reported for this sheet; the others still load
+                loaded.append((sheet_name, None, None, str(e)))
+    finally:
+        workbook.close()
+    return loaded
+
+
+def iqr_bounds(q1, q3):
+    """
+    Lower and upper outlier fences of the IQR method: Q1 - 1.5 IQR and Q3 + 1.5 IQR.
+    """
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def count_values(series):
+    """
+    Returns (missing count, counts of the non-missing values, most frequent first) from one value_counts().
+    """
+    counts = series.value_counts(dropna=False)
+    is_missing = counts.index.isna()
+    return int(counts[is_missing].sum()), counts[~is_missing & (counts > 0)] # Categoricals list unused categories with 0
+
+
+# Colliding value groups kept per column in findings["categorical_variants"], most rows first.
+CATEGORICAL_VARIANT_GROUPS = 10
+
+
+def text_consistency(value_counts):
+    """
+    Whitespace and casing checks on a text column's distinct values, as given by
+    ColumnStatistics.value_counts(), so no pass over the rows is needed.
+    Works with vectorized string operations on the distinct values only. Returns
+    (rows with leading/trailing whitespace, distinct values with whitespace, colliding groups),
+    where colliding groups are the distinct values that become equal once stripped and
+    lowercased, with the rows each variant covers: [{'value': normalized, 'variants': {raw: rows}}],
+    most rows first, plus the total number of such groups.
+    """
+    import numpy as np
+    import pandas as pd
+
+    values = value_counts.index.astype(str)
+    counts = pd.Series(value_counts.to_numpy(), index=values)
+    if not values.is_unique: # Different raw values (e.g. 1 and '1') can share a text form
+        counts = counts.groupby(level=0, sort=False).sum()
+        values = counts.index
+    stripped = values.str.strip()
+    has_whitespace = np.asarray(values != stripped)
+    variants = pd.DataFrame({'raw': values, 'normalized': stripped.str.lower(), 'rows': counts.to_numpy()})
+    variants = variants[variants['normalized'].duplicated(keep=False)]
+    group_rows = variants.groupby('normalized', sort=False)['rows'].sum().sort_values(ascending=False, kind='stable')
+    groups = []
+    for normalized in group_rows.index[:CATEGORICAL_VARIANT_GROUPS]:
+        members = variants[variants['normalized'] == normalized].sort_values('rows', ascending=False, kind='stable')
+        groups.append({'value': normalized, 'variants': dict(zip(members['raw'], members['rows'].astype(int)))})
+    return int(counts.to_numpy()[has_whitespace].sum()), int(has_whitespace.sum()), groups, len(group_rows)
+
+
+# Date formats tried by the date-consistency check, each parsed with a vectorized fixed-format parser.
+# Where two formats read the same text (e.g. 01/02/2020), the one matching more sampled values wins.
+DATE_FORMAT_CANDIDATES = [
+    '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M',
+    '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%m-%d-%Y', '%d.%m.%Y', '%d/%m/%y', '%m/%d/%y',
+    '%d/%m/%Y %H:%M', '%m/%d/%Y %H:%M', '%d/%m/%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S',
+    '%d %b %Y', '%d %B %Y', '%d-%b-%Y', '%d-%b-%y', '%b %d, %Y', '%B %d, %Y',
+]
+# Catch-all for the remaining ISO 8601 variants (fractional seconds, time zones, ...). It reads
+# many of the exact formats too, so it only gets the values none of them matches.
+ISO_DATE_FORMAT = 'ISO8601'
+# Text that looks like part of a date: digits with two separators, or a month name.
+DATE_TOKEN_PATTERN = r'\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|(?i:\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b)'
+# Distinct values sampled to look for date-like text and rank the candidate formats.
+DATE_SAMPLE_VALUES = 1_000
+
+
+def infer_date_formats(value_counts, sample_values=DATE_SAMPLE_VALUES, seed=0):
+    """
+    Works out which date formats a text column uses, from its distinct values (as given by
+    ColumnStatistics.value_counts()) rather than every row.
+    A random sample of the distinct values is checked for date-like text first; without any,
+    the column is not treated as dates and None is returned. Otherwise the candidate formats
+    that match the sample are ranked by matches and every distinct value is parsed with them in
+    turn (fixed-format parsing, no per-value guessing); ISO_DATE_FORMAT only parses what they
+    leave. Returns {'formats': {format: rows}, 'unparsed': non-missing rows no format matches},
+    formats ordered by rows.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if value_counts.empty:
+        return None
+    values = pd.Series(value_counts.index.astype(str), dtype=object)
+    rows = value_counts.to_numpy()
+    sample = values.sample(min(sample_values, len(values)), random_state=seed)
+    if not sample.str.contains(DATE_TOKEN_PATTERN).any():
+        return None # No date-like text: skip the column
+
+    def parses(text, date_format):
+        # utc=True: values with different UTC offsets (or none) cannot share a timezone otherwise,
+        # and pandas raises on them even with errors='coerce'
+        return pd.to_datetime(text, format=date_format, errors='coerce', utc=True).notna().to_numpy()
+
+    sample_hits = {date_format: int(parses(sample, date_format).sum()) for date_format in DATE_FORMAT_CANDIDATES}
+    seen = sorted((f for f in DATE_FORMAT_CANDIDATES if sample_hits[f]), key=lambda f: -sample_hits[f])
+    unseen = [f for f in DATE_FORMAT_CANDIDATES if not sample_hits[f]]
+    formats = {}
+
+    def parse_with(date_formats, remaining):
+        # Each format claims the values it parses; the rest go on to the next format
+        for date_format in date_formats:
+            if not len(remaining):
+                break
+            parsed = parses(values.iloc[remaining], date_format)
+            if parsed.any():
+                formats[date_format] = int(rows[remaining[parsed]].sum())
+                remaining = remaining[~parsed]
+        return remaining
+
+    # Formats seen in the sample first (most matches first). The others are only tried on
+    # leftover values that look like dates, which are usually few.
+    remaining = parse_with(seen, np.arange(len(values)))
+    looks_like_date = values.iloc[remaining].str.contains(DATE_TOKEN_PATTERN).to_numpy()
+    unparsed = rows[remaining[~looks_like_date]].sum()
+    unparsed += rows[parse_with(unseen + [ISO_DATE_FORMAT], remaining[looks_like_date])].sum()
+    return {
+        'formats': dict(sorted(formats.items(), key=lambda item: -item[1])),
+        'unparsed': int(unparsed),
+    }
+
+
+def is_text_column(series):
+    """
+    Returns True for object and string columns, including Arrow-backed strings
+    and categorical columns whose categories are text (see plan_dtypes()).
+    """
+    import pandas as pd
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def to_numeric_coerce(series):
+    """
+    pd.to_numeric(errors='coerce') that also works on Arrow-backed strings, where pandas
+    returns unparseable values as NaN instead of missing.
+    """
+    import pandas as pd
+
+    numbers = pd.to_numeric(series, errors='coerce')
+    if isinstance(numbers.dtype, pd.ArrowDtype) and pd.api.types.is_float_dtype(numbers.dtype):
+        numbers = numbers.astype('float64') # NaN and <NA> both become missing
+    return numbers
+
+
+def numeric_coercion(value_counts):
+    """
+    How well a text column parses as numbers, from a single to_numeric_coerce() call over its
+    distinct values (as given by ColumnStatistics.value_counts()) rather than every row.
+    Returns ({'parsed': rows that parse, 'unparsed': non-missing rows that do not,
+    'ratio': share of non-missing rows that parse}, the distinct values as numbers).
+    """
+    import pandas as pd
+
+    numbers = to_numeric_coerce(pd.Series(value_counts.index))
+    rows = value_counts.to_numpy()
+    parsed = int(rows[numbers.notna().to_numpy()].sum())
+    non_null = int(rows.sum())
+    coercion = {
+        'parsed': parsed,
+        'unparsed': non_null - parsed,
+        'ratio': parsed / non_null if non_null else 0.0,
+    }
+    return coercion, numbers.to_numpy() # Aligned with value_counts.index
+
+
+def profile_column(table_block_name, codes_block_name, rows):
+    """
+    Computes the per-column statistics behind the quality checks for one column, which
+    arrives as an Arrow IPC stream in the shared memory block `table_block_name`.
+    The column's hash index (pandas.factorize codes, `rows` int64 values) is written to the
+    shared memory block `codes_block_name` instead of being returned. Returns a dictionary
+    with 'missing' and 'value_counts', plus 'quartiles' (Q1, median, Q3) and 'outliers'
+    ({'count', 'examples'} or None) for numerical columns, and 'text_consistency',
+    'numeric_coercion', 'distinct_numbers' and 'date_formats' for text columns, keyed
+    like the ColumnStatistics cache.
+    """
+    from multiprocessing import shared_memory
+    import pyarrow as pa
+
+    table_block = shared_memory.SharedMemory(name=table_block_name)
+    reader = series = None
+    try:
+        # Read in place: the column's buffers stay views of the block until the profile is done
+        with pa.ipc.open_stream(pa.py_buffer(table_block.buf)) as reader:
+            series = reader.read_pandas().iloc[:, 0]
+        return _profile_series(series, codes_block_name, rows)
+    finally:
+        reader = series = None # The block cannot be closed while a view of it exists
+        try:
+            table_block.close()
+        except BufferError:
+            pass # A failed profile's traceback still holds views; the mapping goes with them
+
+def _profile_series(series, codes_block_name, rows):
+    """
+    profile_column() for a column already read out of shared memory. The result holds
+    no views of the column, so the column's block can be closed afterwards.
+    """
+    from multiprocessing import shared_memory
+    import numpy as np
+    import pandas as pd
+
+    missing, value_counts = count_values(series)
+    profile = {'missing': missing, 'value_counts': value_counts}
+
+    codes_block = shared_memory.SharedMemory(name=codes_block_name)
+    try:
+        codes = np.ndarray(rows, dtype=np.int64, buffer=codes_block.buf)
+        codes[:] = pd.factorize(series)[0]
+        del codes # The block cannot be closed while a view of it exists
+    finally:
+        codes_block.close()
+
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        q1, median, q3 = series.quantile([0.25, 0.5, 0.75]).tolist()
+        lower_bound, upper_bound = iqr_bounds(q1, q3)
+        values = series.to_numpy(dtype='float64', na_value=np.nan) # Missing values compare False
+        outlier_rows = np.flatnonzero((values < lower_bound) | (values > upper_bound))
+        profile['quartiles'] = (q1, median, q3)
+        profile['outliers'] = {
+            'count': len(outlier_rows),
+            'examples': series.iloc[outlier_rows[:5]].tolist(),
+        } if len(outlier_rows) else None
+    elif is_text_column(series):
+        profile['text_consistency'] = text_consistency(value_counts)
+        profile['numeric_coercion'], profile['distinct_numbers'] = numeric_coercion(value_counts)
+        profile['date_formats'] = infer_date_formats(value_counts)
+    return profile